@@ -16,6 +16,7 @@ from pydantic import BaseModel, Field
 
 from utils.ai_client import WatsonXClient, WatsonXConfig
 from utils.ai_client.exceptions import APIError, AuthenticationError
+from utils.json_utils import json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -149,7 +150,7 @@ Focus on realistic, practical business concerns rather than theoretical legal is
         # Try to extract from original JSON structure if it exists
         try:
             if summary.strip().startswith('{'):
-                parsed = json.loads(summary)
+                parsed = json_loads(summary)
                 
                 # Look for structured key points in various fields
                 points_sources = []
@@ -567,7 +568,7 @@ def _process_ai_summary_response(summary: str, original_text: str, summary_type:
     # Handle case where AI returns JSON despite asking for plain text
     if summary.strip().startswith('{'):
         try:
-            parsed = json.loads(summary)
+            parsed = json_loads(summary)
             
             # Extract meaningful summary text from various possible fields
             extracted_text = _extract_text_from_json_response(parsed)
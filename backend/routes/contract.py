@@ -286,7 +286,7 @@ async def calculate_risk_score(
             )
         
         # Calculate risk score
-        risk_score = await analyzer.calculate_risk_score(analysis_response)
+        risk_score = analyzer.calculate_risk_score(analysis_response)
         
         logger.info(f"Risk score calculated: {risk_score.overall_score}/100")
         
@@ -1,9 +1,16 @@
+import asyncio
+import heapq
 import json
 import logging
 import os
 import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from functools import cached_property, lru_cache
+from hashlib import blake2b
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Set
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple, Set
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -14,17 +21,745 @@ from models.ContractAnalysisModel import ContractAnalysisRequest
 from models.ContractAnalysisResponseModel import ContractAnalysisResponse, ClauseFlag, ComplianceFeedback
 from models.ComplianceRiskScore import ComplianceRiskScore
 from utils.law_loader import LawLoader
+from utils.json_utils import json_loads, json_dumps
 from service.RegulatoryEngineService import RegulatoryEngineService
 from utils.ai_client import WatsonXClient, WatsonXConfig
 from utils.ai_client.exceptions import ConfigurationError, APIError, AuthenticationError 
 
+# pyahocorasick, when installed, finds every metadata keyword in a single pass over the text
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Markdown and HTML cleanup applied by _preprocess_contract_text
+_MD_HEADER_RE = re.compile(r'^#{1,6}\s+.*$', re.MULTILINE)
+_MD_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_MD_ITALIC_RE = re.compile(r'\*(.*?)\*')
+_MD_CODE_RE = re.compile(r'`(.*?)`')
+_MD_LIST_MARKER_RE = re.compile(r'^\s*[-*+]\s+', re.MULTILINE)
+_MD_NUMBERED_MARKER_RE = re.compile(r'^\s*\d+\.\s+(?=[A-Z])', re.MULTILINE)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+# Runs of spaces and tabs are collapsed to one space. A lone space already is one, so it is left out
+# of the pattern: matching every word gap made the substitution the most expensive preprocessing pass
+_SPACE_RUN_RE = re.compile(r' [ \t]+|\t[ \t]*')
+
+# Document metadata and other non-contract lines removed during preprocessing, as one alternation
+# so the document is scanned once. Every branch is anchored to a line start and only removes that
+# line's content plus surrounding whitespace, so matching them together leaves the same lines behind
+_NON_CONTRACT_LINES_RE = re.compile('|'.join((
+    r'^(contract analysis|legal review|summary|overview|analysis|review):.*$',
+    r'^(note|disclaimer|warning|important):.*$',
+    r'^(created by|generated by|analyzed by|document|title):.*$',
+    r'^(version|date|status|author):.*$',
+    r'^(page \d+|header|footer):.*$',
+    r'^\s*(summary|conclusion|recommendations?):\s*$',  # Section headers only
+    r'^\s*-{3,}\s*$',  # Markdown dividers
+    r'^\s*={3,}\s*$',  # Underlines
+)), re.IGNORECASE | re.MULTILINE)
+
+# Lines that are formatting rather than contract content: only special characters, or a bare
+# page/section number. Both checks share one pattern so each line costs a single match
+_FORMATTING_LINE_RE = re.compile(r'^(?:[^\w]*|(?i:(?:page|section|article|chapter)\s*\d+\s*))$')
+
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+_ADJACENT_SENTENCE_ENDS_RE = re.compile(r'[.!?]{2}')
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n\s*')
+
+# Sections and paragraphs with less stripped content than this are treated as formatting
+_MIN_SECTION_CONTENT_CHARS = 50
+
+# Section detection patterns used by _extract_contract_sections_only, in priority order
+_CONTRACT_SECTION_PATTERNS = tuple(re.compile(pattern, re.MULTILINE | re.DOTALL) for pattern in (
+    # Pattern 1: Numbered contract sections (e.g., "1. Definitions", "2.1 Scope")
+    r'\n\s*(\d+(?:\.\d+)*)\.\s+([A-Z][^.\n]{5,50}?)\s*\n((?:(?!\n\s*\d+(?:\.\d+)*\.)(?:[^\n]+\n?))*)',
+    
+    # Pattern 2: Lettered sections (e.g., "A. Terms", "B. Conditions")
+    r'\n\s*([A-Z])\.\s+([A-Z][^.\n]{5,50}?)\s*\n((?:(?!\n\s*[A-Z]\.)(?:[^\n]+\n?))*)',
+    
+    # Pattern 3: Named sections in contracts (e.g., "WHEREAS", "NOW THEREFORE")
+    r'\n\s*(WHEREAS|NOW THEREFORE|WITNESSETH|RECITALS?)\s*[,:]\s*\n((?:[^\n]+\n?)*?)(?=\n\s*(?:WHEREAS|NOW THEREFORE|WITNESSETH|\d+\.|[A-Z]{3,})|$)',
+    
+    # Pattern 4: Title case sections with substantial content
+    r'\n\s*([A-Z][a-z][^.\n]{10,80}?)\s*[:.]?\s*\n((?:[^\n]+\n?){3,}?)(?=\n\s*[A-Z][a-z][^.\n]{10,80}?[:.]?\s*\n|$)'
+))
+
+# Literal keywords, one of which must occur for pattern 3 to match; checked with a substring
+# search first so recital-free contracts skip that pattern's scan entirely
+_RECITAL_KEYWORDS = ("WHEREAS", "NOW THEREFORE", "WITNESSETH", "RECITAL")
+
+# Title fragments that disqualify a candidate section in _genuine_contract_section_word_count
+_NON_CONTRACT_TITLES = (
+    "summary", "analysis", "review", "note", "disclaimer", "generated",
+    "created", "overview", "introduction", "conclusion", "appendix",
+    "table of contents", "index", "header", "footer", "document",
+    "title", "subject", "re:", "from:", "to:", "date:", "version",
+    "page", "confidential", "draft", "final", "approved"
+)
+
+# Vocabulary that marks a candidate section as genuine contract language
+_CONTRACT_LANGUAGE_INDICATORS = (
+    "party", "parties", "agreement", "contract", "shall", "will",
+    "hereby", "whereas", "therefore", "obligations", "rights",
+    "terms", "conditions", "provision", "clause", "section"
+)
+
+# Weighted keyword indicators used to detect the contract type
+_TYPE_INDICATORS = {
+    "Employment": {
+        "strong": ("employee", "employer", "employment", "position", "job duties", "workplace", "termination of employment"),
+        "moderate": ("salary", "wage", "work schedule", "benefits", "leave", "resignation"),
+        "weak": ("work", "duties", "responsibilities")
+    },
+    "Service": {
+        "strong": ("service provider", "client", "deliverables", "scope of work", "statement of work"),
+        "moderate": ("services", "performance", "completion", "milestone"),
+        "weak": ("provide", "deliver", "complete")
+    },
+    "Privacy": {
+        "strong": ("privacy policy", "privacy notice", "california consumer privacy act", "ccpa", "personal information collection", "privacy rights"),
+        "moderate": ("personal information", "data collection", "consumer rights", "privacy", "california resident"),
+        "weak": ("collect", "information", "data")
+    },
+    "NDA": {
+        "strong": ("non-disclosure", "confidentiality agreement", "trade secret", "proprietary information"),
+        "moderate": ("confidential", "proprietary", "confidentiality"),
+        "weak": ("information", "disclosure")
+    },
+    "Rental": {
+        "strong": ("landlord", "tenant", "lease agreement", "rental agreement", "premises"),
+        "moderate": ("rent", "lease", "property", "occupancy"),
+        "weak": ("monthly", "deposit")
+    },
+    "Sales": {
+        "strong": ("purchase agreement", "sale agreement", "buyer", "seller", "transfer of ownership"),
+        "moderate": ("purchase", "sale", "goods", "products", "delivery"),
+        "weak": ("buy", "sell", "payment")
+    },
+    "Partnership": {
+        "strong": ("partnership agreement", "joint venture", "business partnership", "profit sharing"),
+        "moderate": ("partner", "partnership", "collaboration", "venture"),
+        "weak": ("together", "joint", "share")
+    }
+}
+
+# Flattened (contract type, keyword, weight) entries so type scoring is a single loop
+_TYPE_KEYWORD_WEIGHTS = tuple(
+    (contract_type, keyword, weight)
+    for contract_type, indicators in _TYPE_INDICATORS.items()
+    for strength, weight in (("strong", 3), ("moderate", 2), ("weak", 1))
+    for keyword in indicators[strength]
+)
+
+
+def _group_type_weights_by_keyword() -> Dict[str, List[Tuple[str, int]]]:
+    """Bucket the type keyword table by keyword, so scoring only visits keywords that were found."""
+    grouped: Dict[str, List[Tuple[str, int]]] = {}
+    for contract_type, keyword, weight in _TYPE_KEYWORD_WEIGHTS:
+        grouped.setdefault(keyword, []).append((contract_type, weight))
+    return grouped
+
+
+_TYPE_WEIGHTS_BY_KEYWORD = _group_type_weights_by_keyword()
+
+# Keywords that hint at the governing jurisdiction of a contract
+_JURISDICTION_INDICATORS = {
+    "MY": ("malaysia", "malaysian", "kuala lumpur", "ringgit", "rm ", "employment act 1955", "companies act 2016"),
+    "SG": ("singapore", "singaporean", "sgd", "singapore dollar", "companies act singapore"),
+    "US": ("united states", "usd", "us dollar", "state of california", "state of new york", "delaware", "california", "ccpa", "california consumer privacy act", "california resident"),
+    "EU": ("european union", "gdpr", "euro", "eur", "brussels", "directive 95/46/ec")
+}
+
+# Phrases whose presence sets each content flag in the contract metadata
+_CONTENT_FEATURE_PHRASES = {
+    "has_data_processing": (
+        "personal data", "data processing", "data protection", "privacy policy",
+        "data subject", "gdpr", "pdpa", "collect information", "process data",
+        "personal information", "california", "ccpa", "consumer rights", "privacy rights",
+        "collect personal", "share data", "sell data", "sale of personal information"
+    ),
+    "has_termination_clauses": (
+        "termination", "terminate this", "end of contract", "contract expiry",
+        "cancellation", "breach of contract", "dissolution"
+    ),
+    "has_payment_terms": (
+        "payment terms", "payment schedule", "compensation", "remuneration",
+        "salary", "wage", "fee", "amount due", "invoice"
+    ),
+    "has_liability_clauses": (
+        "liability", "liable for", "damages", "indemnify", "indemnification",
+        "limitation of liability", "hold harmless", "responsibility for"
+    ),
+    "has_ip_clauses": (
+        "intellectual property", "copyright", "patent", "trademark",
+        "work product", "invention", "proprietary rights", "trade secret"
+    )
+}
+
+def _build_phrase_automaton(phrases):
+    """Build an Aho-Corasick automaton that reports each matched phrase as its value."""
+    automaton = ahocorasick.Automaton()
+    for phrase in phrases:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
+
+def _phrase_matcher(phrases):
+    """Return a predicate telling whether a lowercased text contains any of the phrases."""
+    phrases = tuple(phrases)
+    if ahocorasick is None:
+        return lambda text_lower: any(phrase in text_lower for phrase in phrases)
+    automaton = _build_phrase_automaton(phrases)
+    return lambda text_lower: next(automaton.iter(text_lower), None) is not None
+
+
+# Boilerplate that marks AI-generated requirements and recommendations as placeholders
+_contains_generic_placeholder = _phrase_matcher((
+    "specific statutory requirements missing",
+    "specific actionable legal compliance steps",
+    "general compliance concern identified",
+    "review with legal counsel",
+    "statutory requirements missing",
+    "actionable legal compliance steps"
+))
+
+# Markup and document vocabulary that disqualifies a flagged clause as contract content
+_CLAUSE_FORMATTING_INDICATORS = frozenset((
+    "###", "##", "#", "**", "*", "```", "---", "===",
+    "summary", "analysis", "review", "note", "generated",
+    "created by", "document", "title", "header", "footer"
+))
+
+# Language a flagged clause needs to count as substantive contract content
+_CLAUSE_LEGAL_INDICATORS = (
+    "shall", "will", "agree", "party", "parties", "contract",
+    "obligation", "right", "term", "condition", "provision",
+    "whereas", "therefore", "hereby", "subject to"
+)
+
+# Both clause vocabularies in one automaton, so a clause is scanned once for either kind of phrase
+_CLAUSE_PHRASE_AUTOMATON = (
+    _build_phrase_automaton(_CLAUSE_FORMATTING_INDICATORS.union(_CLAUSE_LEGAL_INDICATORS))
+    if ahocorasick is not None else None
+)
+
+
+def _has_legal_language_without_formatting(clause_lower: str) -> bool:
+    """True if the lowercased clause contains legal language and no formatting indicator."""
+    if _CLAUSE_PHRASE_AUTOMATON is None:
+        return (not any(indicator in clause_lower for indicator in _CLAUSE_FORMATTING_INDICATORS)
+                and any(indicator in clause_lower for indicator in _CLAUSE_LEGAL_INDICATORS))
+    has_legal_language = False
+    for _, phrase in _CLAUSE_PHRASE_AUTOMATON.iter(clause_lower):
+        if phrase in _CLAUSE_FORMATTING_INDICATORS:
+            return False
+        has_legal_language = True
+    return has_legal_language
+
+# Issue wording that is too generic or cosmetic to report
+_contains_generic_issue_wording = _phrase_matcher((
+    'review recommended', 'consider adding', 'may want to include',
+    'formatting issue', 'style concern', 'minor adjustment',
+    'cosmetic change', 'presentation'
+))
+
+# Issue wording that signals a legal (rather than stylistic) problem
+_contains_legal_significance = _phrase_matcher((
+    'violates', 'violation', 'non-compliance', 'prohibited', 'illegal',
+    'breach', 'contravenes', 'mandatory', 'required by law', 'statutory',
+    'regulation', 'act', 'section', 'article', 'code', 'ordinance'
+))
+
+# Legal concepts a medium-severity issue must mention to be kept
+_contains_legal_concept = _phrase_matcher((
+    'liability', 'damages', 'termination', 'breach', 'warranty',
+    'indemnification', 'jurisdiction', 'governing law', 'arbitration',
+    'intellectual property', 'confidentiality', 'non-disclosure'
+))
+
+# Display names for the supported jurisdictions
+_JURISDICTION_NAMES = {
+    "MY": "Malaysia", "SG": "Singapore", "EU": "European Union", "US": "United States"
+}
+
+# Data protection law applicable in each jurisdiction; also the default law for compliance issues.
+# MY maps to PDPA rather than the Employment Act to prevent cross-application to non-employment contracts
+_DATA_PROTECTION_LAWS = {
+    "MY": "PDPA_MY",
+    "SG": "PDPA_SG",
+    "EU": "GDPR_EU",
+    "US": "CCPA_US"
+}
+
+_DATA_PROTECTION_LAW_NAMES = {
+    "MY": "Personal Data Protection Act 2010",
+    "SG": "Personal Data Protection Act 2012",
+    "EU": "GDPR",
+    "US": "CCPA"
+}
+
+# Law identifiers accepted in compliance issues
+_VALID_LAWS = frozenset({"EMPLOYMENT_ACT_MY", "PDPA_MY", "PDPA_SG", "GDPR_EU", "CCPA_US"})
+
+# Laws a compliance issue may cite for each jurisdiction
+_JURISDICTION_LAWS = {
+    "MY": ("EMPLOYMENT_ACT_MY", "PDPA_MY"),
+    "SG": ("PDPA_SG",),
+    "EU": ("GDPR_EU",),
+    "US": ("CCPA_US",)
+}
+
+# Preferred law when an AI response lists several for one issue; PDPA comes first for MY to
+# avoid defaulting to employment law for non-employment contracts
+_JURISDICTION_LAW_PRIORITY = {
+    "MY": ("PDPA_MY", "EMPLOYMENT_ACT_MY"),
+    "SG": ("PDPA_SG",),
+    "EU": ("GDPR_EU",),
+    "US": ("CCPA_US",)
+}
+
+# Issue wording that raises a flagged clause's priority in _apply_critical_legal_analysis
+_CRITICAL_ISSUE_INDICATORS = (
+    'violation', 'violates', 'prohibited', 'critical', 'mandatory',
+    'statutory', 'criminal', 'penalty', 'fine', 'breach', 'illegal',
+    'non-compliance', 'contravenes', 'discrimination'
+)
+_JURISDICTION_CRITICAL_TERMS = {
+    "US": ('discrimination', 'fee', 'service provider', 'response time'),
+    "MY": ('termination', 'overtime', 'working hours', 'minimum wage')
+}
+
+# Base financial exposure per law, scaled by the number of missing requirements in risk scoring
+_LAW_BASE_RISKS = {
+    "EMPLOYMENT_ACT_MY": 12000,
+    "PDPA_MY": 20000,
+    "PDPA_SG": 25000,
+    "GDPR_EU": 50000,
+    "CCPA_US": 75000  # Increased base risk for CCPA due to $7,500 per violation penalty
+}
+
+# Risk score deduction for a compliance issue, indexed by its number of missing requirements
+# (the last entry covers every larger count). CCPA is scored more severely due to strict liability:
+# minor (0-1), moderate (2), severe (3-4) and critical (5+); other laws: minor (0-1), moderate (2-3)
+# and severe (4+) compliance gaps
+_CCPA_RISK_DEDUCTIONS = (12, 12, 20, 30, 30, 40)
+_STANDARD_RISK_DEDUCTIONS = (8, 8, 15, 15, 25)
+
+# Statutory requirements and recommendations substituted for generic AI placeholders, by law.
+# Stored as tuples and copied on use, since callers attach the lists to mutable issue dicts
+_SPECIFIC_REQUIREMENTS = {
+    "EMPLOYMENT_ACT_MY": (
+        "Termination notice provisions do not meet Employment Act 1955 Section 12 minimum requirements (2 weeks for <2 years service, 4 weeks for >2 years service)",
+        "Missing overtime compensation violates Employment Act 1955 Section 60A (minimum 1.5x normal hourly rate required)",
+        "Working hours may exceed Employment Act 1955 Section 60A maximum (8 hours/day, 48 hours/week)",
+        "Annual leave entitlement below Employment Act 1955 Section 60E minimum (8-16 days based on service length)",
+        "Probation period may exceed Employment Act 1955 Section 11 maximum of 6 months",
+        "Missing rest day and public holiday provisions required under Employment Act 1955 Sections 60C, 60D",
+        "Missing EPF contribution provisions required under EPF Act 1991 (11% employee, 12-13% employer)",
+        "Missing SOCSO contribution provisions required under SOCSO Act 1969",
+        "Salary may be below minimum wage requirement of RM1,500 under Minimum Wages Order 2022"
+    ),
+    "PDPA_MY": (
+        "Missing explicit consent mechanisms required under Personal Data Protection Act 2010",
+        "Lacks data subject rights provisions (access, correction, withdrawal) as mandated by PDPA 2010",
+        "Missing purpose limitation clauses required under PDPA 2010 Section 6",
+        "Insufficient data security safeguards as required under PDPA 2010 Section 7"
+    ),
+    "PDPA_SG": (
+        "Missing consent notification requirements under Singapore PDPA 2012",
+        "Lacks data protection officer designation as required by PDPA",
+        "Missing purpose specification and limitation under PDPA 2012"
+    ),
+    "GDPR_EU": (
+        "Missing lawful basis for processing personal data under GDPR Article 6",
+        "Lacks data subject rights implementation as required by GDPR Articles 15-22",
+        "Missing data protection impact assessment requirements under GDPR Article 35",
+        "Insufficient cross-border data transfer safeguards under GDPR Chapter V"
+    ),
+    "CCPA_US": (
+        "Missing Right to Correct personal information under CCPA § 1798.106",
+        "Missing Right to Limit Use of Sensitive Personal Information under CCPA § 1798.121", 
+        "Missing Right of Non-Discrimination under CCPA § 1798.125",
+        "Discriminatory practices for opt-out requests violate CCPA § 1798.125(a)",
+        "Inadequate contact methods - CCPA § 1798.130(a)(1) requires at least 2 methods including toll-free number",
+        "Response time violations - CCPA § 1798.130(a)(2) requires initial response within 45 days",
+        "Prohibited fee structure - CCPA § 1798.130(a)(2) prohibits charging consumers for exercising rights",
+        "Service provider violations - CCPA § 1798.140(ag) restricts service provider data use",
+        "Incomplete Notice at Collection missing CCPA-specific PI categories under § 1798.100(b)",
+        "Missing data sale disclosure and opt-out requirements under CCPA § 1798.115",
+        "Missing consumer privacy rights disclosure under CCPA Section 1798.100",
+        "Lacks opt-out mechanisms as required by California Consumer Privacy Act",
+        "Missing data sale disclosure requirements under CCPA Section 1798.115"
+    )
+}
+
+_SPECIFIC_RECOMMENDATIONS = {
+    "EMPLOYMENT_ACT_MY": (
+        "Add termination clause specifying minimum notice periods: 2 weeks for employees with <2 years service, 4 weeks for >2 years service as per Section 12",
+        "Include overtime payment clause requiring minimum 1.5x normal hourly rate as mandated by Section 60A",
+        "Specify working hours limits: maximum 8 hours per day and 48 hours per week as per Section 60A",
+        "Include annual leave entitlement: 8 days (<2 years), 12 days (2-5 years), 16 days (>5 years) as per Section 60E",
+        "Limit probation period to maximum 6 months as required by Section 11",
+        "Add rest day provisions (1 day per week) and gazetted public holiday entitlements as per Sections 60C, 60D",
+        "Include EPF contribution clause: 11% employee contribution, 12-13% employer contribution as per EPF Act 1991",
+        "Add SOCSO contribution clause for employment injury and invalidity coverage as per SOCSO Act 1969",
+        "Ensure monthly salary meets minimum wage of RM1,500 as per Minimum Wages Order 2022"
+    ),
+    "PDPA_MY": (
+        "Implement clear consent procedures with opt-in mechanisms before collecting personal data",
+        "Add comprehensive data subject rights clauses covering access, correction, and withdrawal of consent",
+        "Include purpose limitation clause specifying exact purposes for data collection and processing",
+        "Implement robust data security measures including encryption and access controls"
+    ),
+    "PDPA_SG": (
+        "Include notification requirements before collecting personal data with clear purpose statements",
+        "Designate data protection officer and include contact details",
+        "Implement consent withdrawal mechanisms and data portability procedures"
+    ),
+    "GDPR_EU": (
+        "Establish clear lawful basis for each type of data processing under Article 6",
+        "Implement comprehensive data subject rights response procedures for Articles 15-22",
+        "Conduct data protection impact assessments for high-risk processing",
+        "Implement appropriate safeguards for international data transfers"
+    ),
+    "CCPA_US": (
+        "Implement all required CCPA consumer rights: Right to Know, Delete, Correct, Limit Use of Sensitive PI, and Non-Discrimination",
+        "Provide at least 2 contact methods including toll-free number as required by CCPA § 1798.130(a)(1)",
+        "Ensure initial response within 45 days and total fulfillment within 90 days per CCPA § 1798.130(a)(2)",
+        "Remove all fees for consumer rights requests - CCPA prohibits charging consumers",
+        "Restrict service providers to specific business purposes only - prohibit use for their own purposes",
+        "Include comprehensive Notice at Collection with all CCPA-required PI categories and disclosures",
+        "Implement proper opt-out mechanisms for data selling under CCPA § 1798.115",
+        "Remove discriminatory practices - cannot charge fees or limit services for exercising rights",
+        "Add consumer privacy notice with clear disclosure of data practices under Section 1798.100",
+        "Implement opt-out mechanisms for data selling and sharing under Section 1798.120",
+        "Establish procedures for consumer rights requests under CCPA"
+    )
+}
+
+_DEFAULT_REQUIREMENTS = ("Contract requires legal review for compliance",)
+_DEFAULT_RECOMMENDATIONS = ("Consult legal counsel for jurisdiction-specific compliance",)
+
+class _GatedPattern(NamedTuple):
+    """
+    A clause-level pattern together with the literals it cannot match without: every match
+    contains at least one phrase from each of literal_groups. Those phrases are found in the same
+    scan as the metadata keywords, so when a group is missing from the contract the regex is
+    skipped without another pass over the text. Without found_phrases the regex always runs.
+    """
+    regex: re.Pattern
+    literal_groups: Tuple[Tuple[str, ...], ...]
+    
+    def may_match(self, found_phrases: Optional[Set[str]]) -> bool:
+        if found_phrases is None:
+            return True
+        return all(not found_phrases.isdisjoint(group) for group in self.literal_groups)
+    
+    def search(self, text: str, found_phrases: Optional[Set[str]] = None) -> Optional[re.Match]:
+        return self.regex.search(text) if self.may_match(found_phrases) else None
+    
+    def finditer(self, text: str, found_phrases: Optional[Set[str]] = None):
+        return self.regex.finditer(text) if self.may_match(found_phrases) else iter(())
+
+
+# Literals of every _GatedPattern, all of which the metadata scan looks for
+_CLAUSE_LITERALS: Set[str] = set()
+
+
+def _gated(pattern: str, *literal_groups: Tuple[str, ...]) -> _GatedPattern:
+    """
+    Compile a clause-level pattern and register its literals with the metadata scan. Only
+    distinctive words are worth listing; short ones such as 'day' or 'rm' occur in nearly
+    every contract and would make the scan report a match on almost every line.
+    """
+    for group in literal_groups:
+        _CLAUSE_LITERALS.update(group)
+    return _GatedPattern(re.compile(pattern), literal_groups)
+
+
+# Employment Act 1955 (MY) provisions searched for in employment contracts
+_EA_NOTICE_RE = _gated(r'(?:notice|termination).*(?:\d+.*(?:week|month|day))', ("notice", "termination"))
+# Bounded gaps keep the hour count and its unit within one clause; an unbounded .* took the first
+# number on the line (often a clause number) and whatever 'day'/'week' came last on it
+_EA_HOURS_RE = _gated(r'(?P<hours>\d+)[^.]{0,40}?hours?[^.]{0,20}?(?:per|each)[^.]{0,10}?(?P<unit>day|week)', ("hour",))
+_EA_OVERTIME_RE = _gated(r'overtime.*(?:compensation|payment|rate|1\.5|time.*half)', ("overtime",))
+_EA_ANNUAL_LEAVE_RE = _gated(r'annual.*leave.*(\d+).*day|(\d+).*day.*annual.*leave', ("annual",), ("leave",))
+_EA_REST_DAY_RE = _gated(r'rest.*day|public.*holiday|gazetted.*holiday', ("rest", "public", "gazetted"))
+_EA_PROBATION_RE = _gated(r'probation.*(\d+).*month|(\d+).*month.*probation', ("probation",))
+_EA_SALARY_RE = _gated(r'salary.*rm\s*(\d+(?:,\d+)*)|rm\s*(\d+(?:,\d+)*).*salary', ("salary",))
+_EA_EPF_RE = _gated(r'epf|employees.*provident.*fund', ("epf", "provident"))
+_EA_SOCSO_RE = _gated(r'socso|social.*security|employment.*injury', ("socso", "security", "injury"))
+
+# Data protection provisions searched for in contracts that process personal data
+_CONSENT_RE = re.compile(r'consent.*(?:explicit|written|informed)')
+_DATA_SUBJECT_RIGHTS_RE = re.compile(r'data subject.*rights')
+_GDPR_RIGHTS_RE = re.compile(r'(?:access|rectification|erasure|portability)')
+_CONSUMER_RIGHTS_RE = re.compile(r'(?:consumer.*rights|privacy.*rights|opt.*out)')
+
+# Clause-level checks in _perform_comprehensive_contract_analysis. All of them run against the
+# lowercased contract, so they are written in lowercase and compiled without IGNORECASE
+_IMMEDIATE_TERMINATION_RES = (
+    _gated(r'terminate.*without.*notice', ("terminate",), ("without",), ("notice",)),
+    _gated(r'dismiss.*immediately', ("dismiss",), ("immediately",)),
+    _gated(r'termination.*effective.*immediately', ("termination",), ("effective",), ("immediately",)),
+    _gated(r'end.*employment.*without.*notice', ("employment",), ("without",), ("notice",))
+)
+_TERMINATION_NOTICE_RES = (
+    _gated(r'(?:notice|termination).*(?:\d+.*(?:week|month|day))', ("notice", "termination")),
+    _gated(r'(\d+).*?(day|week|month).*?(?:notice|termination)', ("notice", "termination"))
+)
+_WORKING_HOURS_RES = (
+    _gated(r'(\d+).*hours?.*(?:per|each).*(?:day|daily)', ("hour",)),
+    _gated(r'(\d+).*hours?.*(?:per|each).*(?:week|weekly)', ("hour",)),
+    _gated(r'working.*hours?.*(\d+).*(?:per|each).*(?:day|week)', ("working",), ("hour",))
+)
+_WAGE_CLAUSE_RE = re.compile(r'(?:salary|wage|compensation|remuneration).*?(?:\.|;|$)', re.DOTALL)
+_LEAVE_MENTION_RE = re.compile(r'annual.*leave|vacation.*day|paid.*leave')
+_ANNUAL_LEAVE_DAYS_RES = (
+    _gated(r'annual.*leave.*(\d+).*day', ("annual",), ("leave",)),
+    _gated(r'vacation.*(\d+).*day', ("vacation",)),
+    _gated(r'(\d+).*day.*annual.*leave', ("annual",), ("leave",))
+)
+_MONTHLY_SALARY_RES = (
+    _gated(r'salary.*rm\s*(\d+(?:,\d+)*)', ("salary",)),
+    _gated(r'wage.*rm\s*(\d+(?:,\d+)*)', ("wage",)),
+    _gated(r'rm\s*(\d+(?:,\d+)*).*(?:salary|wage|month)')
+)
+_PROBATION_MONTHS_RES = (
+    _gated(r'probation.*period.*(\d+).*month', ("probation",), ("period",)),
+    _gated(r'probationary.*(\d+).*month', ("probationary",)),
+    _gated(r'(\d+).*month.*probation', ("probation",))
+)
+_DATA_CLAUSE_RE = re.compile(r'(?:personal.*data|information.*collect).*?(?:\.|$)', re.DOTALL)
+_LIABILITY_CAP_RE = _gated(r'liability.*limited.*to.*(?:rm\s*)?(\d+(?:,\d+)*)', ("liability",), ("limited",))
+_UNILATERAL_MODIFICATION_RE = _gated(
+    r'(?:company|employer|party).*may.*(?:modify|change|alter).*(?:unilaterally|without.*consent)',
+    ("company", "employer", "party"), ("modify", "change", "alter"), ("unilaterally", "without")
+)
+_MODIFICATION_CLAUSE_RE = re.compile(r'(?:company|employer|party).*may.*(?:modify|change|alter).*?(?:\.|$)', re.DOTALL)
+_CONSIDERATION_RE = re.compile(r'consideration|payment|compensation|remuneration')
+
+# CCPA personal information categories counted by _detect_ccpa_violations. The check is a plain
+# substring test, and multi-word categories keep the '.*' spelling it has always used for spaces
+_CCPA_PI_CATEGORY_TERMS = tuple(category.replace(' ', '.*') for category in (
+    'identifiers', 'commercial information', 'biometric information',
+    'internet activity', 'geolocation data', 'sensory data',
+    'professional information', 'education information', 'inferences'
+))
+_CCPA_SENSITIVE_TERMS = ('health', 'biometric', 'genetic', 'precise geolocation', 'racial', 'religious', 'sexual orientation')
+
+# Checks in _detect_ccpa_violations, which run against the lowercased contract
+_CCPA_RIGHT_TO_CORRECT_RE = re.compile(r'right\s+to\s+correct|correct.*personal.*information|rectif')
+_CCPA_LIMIT_SENSITIVE_RE = re.compile(r'limit.*use.*sensitive|sensitive.*personal.*information.*limit|opt.*out.*sensitive')
+_CCPA_NON_DISCRIMINATION_RE = re.compile(r'non.*discrimination|right.*not.*discriminate|equal.*treatment')
+_CCPA_OPT_OUT_FEE_RE = re.compile(r'opt.*out.*(?:may|will|result).*(?:additional|extra).*fee|fee.*opt.*out|charge.*opt.*out')
+_CCPA_OPT_OUT_SERVICE_LIMIT_RE = re.compile(r'opt.*out.*(?:may|will).*limit.*service|service.*limited.*opt.*out')
+_CCPA_TOLL_FREE_RE = re.compile(r'toll.*free|1.*800.*|1.*888.*|1.*877.*|1.*866.*')
+_CCPA_WEBSITE_RE = re.compile(r'website|online.*form|web.*form|www\.|http')
+_CCPA_EMAIL_RE = re.compile(r'email|@.*\.com|contact.*email')
+_CCPA_POSTAL_RE = re.compile(r'mail.*address|postal.*address|mailing.*address|street.*address')
+_CCPA_RESPONSE_DAYS_RE = re.compile(r'respond.*within.*(\d+).*days?|(\d+).*days?.*respond')
+_CCPA_FULFILLMENT_DAYS_RE = re.compile(r'fulfill.*within.*(\d+).*days?|complete.*within.*(\d+).*days?')
+_CCPA_VERIFICATION_FEE_RE = re.compile(r'verification.*fee|fee.*verification|charge.*verify|verification.*cost')
+_CCPA_PROCESSING_FEE_RE = re.compile(r'processing.*fee|fee.*processing|charge.*process.*request')
+_CCPA_RIGHTS_FEE_RE = re.compile(r'fee.*consumer.*request|charge.*consumer.*right|cost.*exercise.*right')
+_CCPA_PROVIDER_OWN_PURPOSE_RE = re.compile(r'service.*provider.*(?:can|may|use).*(?:own|their).*purpose|vendor.*use.*own.*business')
+_CCPA_PROVIDER_SALE_RE = re.compile(r'service.*provider.*(?:sell|share).*data|vendor.*sell.*data|third.*party.*sell')
+_CCPA_PROVIDER_RE = re.compile(r'service.*provider|vendor|third.*party')
+_CCPA_PROVIDER_RESTRICTION_RE = re.compile(r'service.*provider.*(?:shall|must|limited|restrict)')
+_CCPA_RETENTION_RE = re.compile(r'retention.*period|retain.*for|keep.*for.*year|delete.*after')
+_CCPA_SOURCE_RE = re.compile(r'source.*information|collect.*from|obtain.*from|gather.*from')
+_CCPA_THIRD_PARTY_CATEGORIES_RE = re.compile(r'third.*part.*categor|share.*with.*type|disclose.*to.*categor')
+_CCPA_DATA_SALE_RE = re.compile(r'sell.*data|sale.*personal.*information|sell.*personal')
+_CCPA_OPT_OUT_RE = re.compile(r'opt.*out|do.*not.*sell')
+_CCPA_SENSITIVE_DISCLOSURE_RE = re.compile(r'sensitive.*personal.*information|limit.*use.*sensitive')
+
+# Clause extraction in _analyze_ccpa_clause_violations, which runs against the original contract text
+_CCPA_DISCRIMINATION_CLAUSE_RES = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+    r'opt.*out.*(?:may|will|result).*(?:additional|extra).*fee[^.]*\.',
+    r'opt.*out.*(?:may|will).*limit.*service[^.]*\.',
+    r'(?:additional|extra).*fee.*opt.*out[^.]*\.',
+    r'service.*limited.*opt.*out[^.]*\.'
+))
+_CCPA_SERVICE_PROVIDER_CLAUSE_RES = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+    r'service.*provider.*(?:can|may|use).*(?:own|their).*purpose[^.]*\.',
+    r'vendor.*use.*own.*business[^.]*\.',
+    r'service.*provider.*(?:sell|share).*data[^.]*\.',
+    r'third.*party.*sell.*data[^.]*\.'
+))
+_CCPA_FEE_CLAUSE_RES = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+    r'verification.*fee[^.]*\.',
+    r'fee.*verification[^.]*\.',
+    r'processing.*fee.*request[^.]*\.',
+    r'charge.*verify[^.]*\.',
+    r'cost.*exercise.*right[^.]*\.'
+))
+_CCPA_RESPONSE_TIME_CLAUSE_RES = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+    r'respond.*within.*(\d+).*days?[^.]*\.',
+    r'(\d+).*days?.*respond.*request[^.]*\.'
+))
+_FIRST_NUMBER_RE = re.compile(r'(\d+)')
+_CCPA_CONTACT_SECTION_RE = re.compile(r'(?:how.*to.*exercise|contact.*us|exercise.*rights)[\s\S]*?(?=\n\s*#{1,6}|\n\s*\*\*|$)', re.IGNORECASE)
+_CCPA_CONTACT_TOLL_FREE_RE = re.compile(r'toll.*free|1.*800.*|1.*888.*|1.*877.*|1.*866.*', re.IGNORECASE)
+_CCPA_CONTACT_WEBSITE_RE = re.compile(r'website|online.*form|web.*form|www\.|http', re.IGNORECASE)
+_CCPA_CONTACT_EMAIL_RE = re.compile(r'email|@.*\.com', re.IGNORECASE)
+_CCPA_CONTACT_POSTAL_RE = re.compile(r'mail.*address|postal.*address|mailing.*address|street.*address', re.IGNORECASE)
+_CCPA_DATA_SALE_CLAUSE_RE = re.compile(r'(?:sell.*personal.*information|sale.*personal.*data)(?:(?!opt.*out|do.*not.*sell).)*[^.]*\.', re.IGNORECASE | re.DOTALL)
+_CCPA_CLAUSE_OPT_OUT_RE = re.compile(r'opt.*out|do.*not.*sell', re.IGNORECASE)
+
+# Clause analyzers run by _perform_comprehensive_contract_analysis for each (contract type,
+# jurisdiction), in the order their issues are reported
+_CLAUSE_ANALYZERS = {
+    ("Employment", "MY"): (
+        "_analyze_termination_provisions",     # Employment Act 1955, Section 12
+        "_analyze_working_hours_and_overtime",  # Employment Act 1955, Section 60A
+        "_analyze_annual_leave_provisions",     # Employment Act 1955, Section 60E
+        "_analyze_salary_and_benefits",         # Minimum Wages Order 2022
+        "_analyze_probation_period",            # Employment Act 1955, Section 11
+        "_analyze_rest_days_and_holidays",      # Employment Act 1955, Sections 60C, 60D
+        "_analyze_statutory_contributions"      # EPF Act 1991, SOCSO Act 1969
+    )
+}
+
+_NON_ASCII_CHAR_RE = re.compile(r'[^\x00-\x7f]')
+
+
+def _is_special_char(c: str) -> bool:
+    return not c.isalnum() and not c.isspace()
+
+
+def _ascii_deleter(predicate) -> bytes:
+    """Bytes of every ASCII character that does not satisfy predicate, for bytes.translate."""
+    return bytes(code for code in range(128) if not predicate(chr(code)))
+
+
+_ASCII_NON_SPECIAL = _ascii_deleter(_is_special_char)
+_ASCII_NON_UPPER = _ascii_deleter(str.isupper)
+_ASCII_NON_ALPHA = _ascii_deleter(str.isalpha)
+
+
+def _count_chars(text: str, ascii_non_matching: bytes, predicate) -> int:
+    """
+    Count characters satisfying predicate. ASCII characters are counted in C with bytes.translate;
+    only the (usually few) non-ASCII characters go through the Python-level predicate.
+    """
+    count = len(text.encode('ascii', 'ignore').translate(None, ascii_non_matching))
+    if not text.isascii():
+        count += sum(1 for c in _NON_ASCII_CHAR_RE.findall(text) if predicate(c))
+    return count
+
+
+def _count_special_chars(text: str) -> int:
+    """Count characters that are neither alphanumeric nor whitespace."""
+    return _count_chars(text, _ASCII_NON_SPECIAL, _is_special_char)
+
+
+def _uppercase_ratio(text: str) -> float:
+    """Share of alphabetic characters that are uppercase."""
+    # One encode serves both tallies; ASCII uppercase letters are a subset of the ASCII letters
+    ascii_alpha = text.encode('ascii', 'ignore').translate(None, _ASCII_NON_ALPHA)
+    alpha_count = len(ascii_alpha)
+    upper_count = len(ascii_alpha.translate(None, _ASCII_NON_UPPER))
+    if not text.isascii():
+        for c in _NON_ASCII_CHAR_RE.findall(text):
+            alpha_count += c.isalpha()
+            upper_count += c.isupper()
+    return upper_count / max(alpha_count, 1)
+
+
+def _count_sentence_ends(text: str) -> int:
+    """Number of runs of sentence terminators, as counted by _SENTENCE_END_RE."""
+    count = text.count('.') + text.count('!') + text.count('?')
+    # Each terminator is its own run unless two are adjacent ("...", "?!"), which is rare in contracts
+    if count and _ADJACENT_SENTENCE_ENDS_RE.search(text):
+        return len(_SENTENCE_END_RE.findall(text))
+    return count
+
+
+def _match_excerpt(match: re.Match, text: str, limit: int = 200) -> str:
+    """
+    First limit characters of text covered by a match, with an ellipsis if the match is longer.
+    Slices text by the match span instead of copying the match, since greedy DOTALL matches can
+    span most of the contract. Passing the original text keeps its case when a lowercased copy was searched.
+    """
+    start, end = match.span()
+    excerpt = text[start:min(end, start + limit)]
+    return excerpt + "..." if end - start > limit else excerpt
+
+
+def _lowercase_aligned(text: str, text_lower: str) -> str:
+    """
+    Lowercased text whose character offsets line up with text, so matches found in it can be
+    sliced out of the original. str.lower() only breaks the alignment for the few characters
+    that lowercase to several (e.g. 'İ'); those are kept as they are.
+    """
+    if len(text_lower) == len(text):
+        return text_lower
+    return ''.join(lower if len(lower := c.lower()) == 1 else c for c in text)
+
+
+# Every phrase _analyze_contract_metadata looks for, plus the clause pattern literals
+_METADATA_PHRASES = frozenset(
+    [keyword for _, keyword, _ in _TYPE_KEYWORD_WEIGHTS]
+    + [phrase for phrases in _CONTENT_FEATURE_PHRASES.values() for phrase in phrases]
+    + [indicator for indicators in _JURISDICTION_INDICATORS.values() for indicator in indicators]
+    + sorted(_CLAUSE_LITERALS)
+)
+
+_METADATA_AUTOMATON = _build_phrase_automaton(_METADATA_PHRASES) if ahocorasick is not None else None
+
+
+def _find_metadata_phrases(text_lower: str) -> Set[str]:
+    """Return the metadata phrases that occur in the lowercased contract text."""
+    if _METADATA_AUTOMATON is not None:
+        return {phrase for _, phrase in _METADATA_AUTOMATON.iter(text_lower)}
+    return {phrase for phrase in _METADATA_PHRASES if phrase in text_lower}
+
+
+# Number of distinct contract texts whose preprocessing/metadata results are kept in memory
+_PREPARED_CONTRACT_CACHE_SIZE = 64
+
+# Raw Granite responses are reused for identical (contract, jurisdiction, contract type) requests
+# for a few minutes
+_GRANITE_RESPONSE_CACHE_SIZE = 256
+_GRANITE_RESPONSE_TTL_SECONDS = 300
+
+
+def _positive_int_from_env(name: str, default: int) -> int:
+    """Integer setting from the environment, falling back to default when unset, malformed or below 1."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = 0
+    if parsed < 1:
+        logger.warning(f"Ignoring invalid {name}={value!r}; using {default}")
+        return default
+    return parsed
+
+
+# At most this many WatsonX requests are in flight at once
+_WATSONX_MAX_CONCURRENCY = _positive_int_from_env("WATSONX_MAX_CONCURRENCY", 4)
+
+
 class ContractAnalyzerService:
     def __init__(self):
-        self.law_loader = LawLoader()
-        self.regulatory_engine = RegulatoryEngineService(self.law_loader)
         self.watsonx_client = None
+        self._prepared_contract_cache: "OrderedDict[bytes, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        # Contracts are prepared in worker threads, so cache reads and updates hold this lock
+        self._prepared_contract_lock = threading.Lock()
+        self._granite_response_cache: "OrderedDict[Tuple[bytes, str, str], Tuple[float, str]]" = OrderedDict()
+        self._granite_response_lock = threading.Lock()
+        # Bounds the WatsonX calls in flight. Requests wait for a slot on the event loop, so they do
+        # not hold the worker threads that contract preparation also runs on
+        self._watsonx_slots = asyncio.Semaphore(_WATSONX_MAX_CONCURRENCY)
+        # Credentials are read once here rather than from the environment on every request
+        self._watsonx_credentials_set = bool(os.getenv("IBM_API_KEY")) and bool(os.getenv("WATSONX_PROJECT_ID"))
         
         # Initialize our custom WatsonX AI client
         try:
@@ -37,18 +772,26 @@ class ContractAnalyzerService:
         except Exception as e:
             logger.error(f"Failed to initialize WatsonX client: {e}")
             self.watsonx_client = None
+    
+    @cached_property
+    def law_loader(self) -> LawLoader:
+        """Law database, loaded on first use rather than when the service is constructed."""
+        return LawLoader()
+    
+    @cached_property
+    def regulatory_engine(self) -> RegulatoryEngineService:
+        """Regulatory engine over the lazily loaded law database."""
+        return RegulatoryEngineService(self.law_loader)
                 
     async def analyze_contract(self, request: ContractAnalysisRequest) -> ContractAnalysisResponse:
         """
         Main contract analysis orchestrator with enhanced content-aware analysis.
         """
         try:
-            # 1. Pre-process and clean the contract text
-            cleaned_contract = self._preprocess_contract_text(request.text)
+            # 1-2. Pre-process the contract text and analyze its structure and content type. This is
+            # CPU-bound regex work, so it runs in a worker thread instead of blocking the event loop
+            cleaned_contract, contract_metadata = await asyncio.to_thread(self._prepare_contract, request.text)
             logger.info(f"Contract preprocessing complete. Original length: {len(request.text)}, Cleaned length: {len(cleaned_contract)}")
-            
-            # 2. Analyze contract structure and content type
-            contract_metadata = self._analyze_contract_metadata(cleaned_contract)
             logger.info(f"Contract analysis: Type={contract_metadata['type']}, Sections={len(contract_metadata['sections'])}, Has_Data_Processing={contract_metadata['has_data_processing']}")
             
             # 3. Get the applicable compliance rules from our engine
@@ -59,23 +802,27 @@ class ContractAnalyzerService:
             )
 
             # 4. Use IBM WatsonX AI with enhanced prompting
-            api_key = os.getenv("IBM_API_KEY")
-            project_id = os.getenv("WATSONX_PROJECT_ID")
-            use_real_ai = (self.watsonx_client is not None and api_key and project_id)
+            use_real_ai = self.watsonx_client is not None and self._watsonx_credentials_set
+
+            # Locally generated analysis is kept as a dict; only external Granite text needs JSON parsing
+            ai_json = None
 
             if use_real_ai:
                 try:
                     logger.info("Making request to IBM WatsonX AI with Granite model for legal analysis")
-                    # Use enhanced prompting with contract metadata
-                    ai_response_text = self._get_granite_analysis_with_context(
-                        cleaned_contract, contract_metadata, compliance_checklist, jurisdiction
-                    )
+                    # Use enhanced prompting with contract metadata. The WatsonX round-trip is blocking
+                    # network I/O that releases the GIL, so run it in a worker thread to keep the event loop free
+                    async with self._watsonx_slots:
+                        ai_response_text = await asyncio.to_thread(
+                            self._get_granite_analysis_with_context,
+                            cleaned_contract, contract_metadata, compliance_checklist, jurisdiction
+                        )
                     logger.info(f"IBM Granite AI Response received: {ai_response_text[:200]}...")
                     
                     # Validate the AI response
                     if self._is_granite_response_minimal(ai_response_text):
                         logger.info("IBM Granite response appears minimal, enhancing with domain expertise")
-                        ai_response_text = self._get_intelligent_mock_analysis(
+                        ai_json = self._build_analysis_dict(
                             cleaned_contract, contract_metadata, compliance_checklist, jurisdiction
                         )
                     else:
@@ -83,24 +830,26 @@ class ContractAnalyzerService:
                         
                 except (APIError, AuthenticationError) as e:
                     logger.error(f"WatsonX API error: {e}")
-                    ai_response_text = self._get_intelligent_mock_analysis(
+                    ai_json = self._build_analysis_dict(
                         cleaned_contract, contract_metadata, compliance_checklist, jurisdiction
                     )
                 except Exception as e:
                     logger.error(f"Unexpected error calling IBM WatsonX: {e}")
-                    ai_response_text = self._get_intelligent_mock_analysis(
+                    ai_json = self._build_analysis_dict(
                         cleaned_contract, contract_metadata, compliance_checklist, jurisdiction
                     )
             else:
                 logger.warning("IBM WatsonX client not properly configured - using intelligent mock for demo")
-                ai_response_text = self._get_intelligent_mock_analysis(
+                ai_json = self._build_analysis_dict(
                     cleaned_contract, contract_metadata, compliance_checklist, jurisdiction
                 )
 
             # 5. Parse and validate the AI's JSON response
             try:
-                ai_json = json.loads(ai_response_text)
-                ai_json = self._clean_ai_response(ai_json, jurisdiction, cleaned_contract)
+                if ai_json is None:
+                    ai_json = self._clean_ai_response(json_loads(ai_response_text), jurisdiction, cleaned_contract)
+                else:
+                    ai_json = self._clean_ai_response(ai_json, jurisdiction, cleaned_contract, compliance_validated=True)
                 
                 # Ensure we have meaningful analysis
                 if not ai_json.get("compliance_issues") and not ai_json.get("flagged_clauses"):
@@ -109,21 +858,22 @@ class ContractAnalyzerService:
                         cleaned_contract, contract_metadata, jurisdiction
                     )
                 
-                # Convert law_id to law for compatibility
-                if "compliance_issues" in ai_json:
-                    for issue in ai_json["compliance_issues"]:
-                        if "law_id" in issue and "law" not in issue:
-                            issue["law"] = issue.pop("law_id")
-                
                 # Ensure required fields
                 ai_json.setdefault("summary", "Analysis complete.")
                 ai_json.setdefault("flagged_clauses", [])
                 ai_json.setdefault("compliance_issues", [])
                 
+                # Convert law_id to law for compatibility while building the response models
+                compliance_issues = []
+                for issue in ai_json["compliance_issues"]:
+                    if "law_id" in issue and "law" not in issue:
+                        issue["law"] = issue.pop("law_id")
+                    compliance_issues.append(ComplianceFeedback(**issue))
+                
                 return ContractAnalysisResponse(
                     summary=ai_json["summary"],
                     flagged_clauses=[ClauseFlag(**flag) for flag in ai_json["flagged_clauses"]],
-                    compliance_issues=[ComplianceFeedback(**issue) for issue in ai_json["compliance_issues"]],
+                    compliance_issues=compliance_issues,
                     jurisdiction=jurisdiction
                 )
                 
@@ -148,193 +898,30 @@ class ContractAnalyzerService:
             logger.error(f"Contract analysis failed: {str(e)}")
             raise
 
-    def _preprocess_contract_text(self, contract_text: str) -> str:
-        """
-        Enhanced preprocessing to remove formatting artifacts and focus on actual contract content.
-        """
-        # Remove markdown headers and formatting
-        text = re.sub(r'^#{1,6}\s+.*$', '', contract_text, flags=re.MULTILINE)
-        
-        # Remove markdown emphasis
-        text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
-        text = re.sub(r'\*(.*?)\*', r'\1', text)
-        
-        # Remove markdown lists that aren't contract content
-        text = re.sub(r'^\s*[-*+]\s+', '', text, flags=re.MULTILINE)
-        
-        # Remove HTML tags if present
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Remove excessive whitespace but preserve paragraph structure
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-        text = re.sub(r'[ \t]+', ' ', text)
-        
-        # Remove common non-contract content patterns
-        non_contract_patterns = [
-            r'(?i)^(contract analysis|legal review|summary|overview):.*$',
-            r'(?i)^(note|disclaimer|warning):.*$',
-            r'(?i)^(created by|generated by|analyzed by):.*$',
-        ]
-        
-        for pattern in non_contract_patterns:
-            text = re.sub(pattern, '', text, flags=re.MULTILINE)
-        
-        # Clean up and normalize
-        text = text.strip()
-        
-        # If text is too short after cleaning, it might not be a real contract
-        if len(text.strip()) < 100:
-            logger.warning("Contract text appears to be very short after preprocessing")
-        
-        return text
-    
-    def _analyze_contract_metadata(self, contract_text: str) -> Dict[str, Any]:
-        """
-        Analyze contract structure and content to understand what type of contract this is
-        and what specific legal areas it touches.
-        """
-        text_lower = contract_text.lower()
-        
-        # Detect contract type based on content analysis
-        contract_type = "General"
-        type_indicators = {
-            "Employment": ["employee", "employer", "employment", "salary", "wage", "termination", "workplace", "job duties", "position", "work schedule"],
-            "Service": ["services", "service provider", "client", "deliverables", "scope of work", "performance"],
-            "NDA": ["confidential", "non-disclosure", "proprietary", "trade secret", "confidentiality"],
-            "Rental": ["tenant", "landlord", "rent", "lease", "property", "premises", "rental"],
-            "Sales": ["purchase", "buyer", "seller", "goods", "products", "sale", "delivery"],
-            "Partnership": ["partner", "partnership", "joint venture", "profit sharing", "collaboration"]
-        }
-        
-        max_score = 0
-        for contract_type_candidate, keywords in type_indicators.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            if score > max_score:
-                max_score = score
-                contract_type = contract_type_candidate
-        
-        # Analyze content areas
-        has_data_processing = any(term in text_lower for term in [
-            "personal data", "data processing", "privacy", "information", "data subject", "gdpr", "pdpa"
-        ])
-        
-        has_termination_clauses = any(term in text_lower for term in [
-            "termination", "terminate", "end of contract", "expiry", "cancellation"
-        ])
-        
-        has_payment_terms = any(term in text_lower for term in [
-            "payment", "pay", "salary", "wage", "compensation", "fee", "amount", "money"
-        ])
-        
-        has_liability_clauses = any(term in text_lower for term in [
-            "liable", "liability", "damages", "indemnify", "responsibility", "loss"
-        ])
-        
-        has_ip_clauses = any(term in text_lower for term in [
-            "intellectual property", "copyright", "patent", "trademark", "work product", "invention"
-        ])
-        
-        # Extract meaningful sections
-        sections = self._extract_meaningful_sections(contract_text)
-        
-        # Detect jurisdiction indicators in the text
-        jurisdiction_indicators = {
-            "MY": ["malaysia", "malaysian", "kuala lumpur", "ringgit", "employment act 1955"],
-            "SG": ["singapore", "singaporean", "sgd", "singapore dollar"],
-            "US": ["united states", "usd", "dollar", "state of", "california", "new york"],
-            "EU": ["european union", "gdpr", "euro", "eur"]
-        }
-        
-        detected_jurisdictions = []
-        for jurisdiction, indicators in jurisdiction_indicators.items():
-            if any(indicator in text_lower for indicator in indicators):
-                detected_jurisdictions.append(jurisdiction)
-        
-        return {
-            "type": contract_type,
-            "has_data_processing": has_data_processing,
-            "has_termination_clauses": has_termination_clauses,
-            "has_payment_terms": has_payment_terms,
-            "has_liability_clauses": has_liability_clauses,
-            "has_ip_clauses": has_ip_clauses,
-            "sections": sections,
-            "detected_jurisdictions": detected_jurisdictions,
-            "word_count": len(contract_text.split()),
-            "is_substantial": len(contract_text.strip()) > 500  # Flag for substantial contracts
-        }
-    
-    def _extract_meaningful_sections(self, contract_text: str) -> List[Dict[str, str]]:
-        """
-        Extract meaningful contract sections, ignoring formatting artifacts.
-        """
-        sections = []
-        
-        # Try different section detection patterns
-        section_patterns = [
-            r'\n\s*(\d+)\.\s*([A-Z][^.\n]*[.:]?)\s*\n((?:[^\n]+\n?)*?)(?=\n\s*\d+\.|$)',  # Numbered sections
-            r'\n\s*([A-Z][A-Z\s]{2,}):?\s*\n((?:[^\n]+\n?)*?)(?=\n\s*[A-Z][A-Z\s]{2,}:|$)',  # ALL CAPS headers
-            r'\n\s*([A-Z][^.\n]*):?\s*\n((?:[^\n]+\n?)*?)(?=\n\s*[A-Z][^.\n]*:|$)'  # Title Case headers
-        ]
-        
-        for pattern in section_patterns:
-            matches = re.finditer(pattern, contract_text, re.MULTILINE | re.DOTALL)
-            for match in matches:
-                if len(match.groups()) >= 2:
-                    title = match.group(1).strip() if len(match.groups()) > 1 else f"Section {match.group(1)}"
-                    content = match.group(2).strip() if len(match.groups()) > 2 else match.group(2).strip()
-                    
-                    # Skip sections that are too short or look like formatting artifacts
-                    if len(content) > 50 and not self._is_formatting_artifact(title, content):
-                        sections.append({
-                            "title": title,
-                            "content": content,
-                            "word_count": len(content.split())
-                        })
-            
-            if sections:  # If we found sections with one pattern, use those
-                break
-        
-        # Fallback: split by paragraphs if no clear sections found
-        if not sections:
-            paragraphs = re.split(r'\n\s*\n\s*', contract_text)
-            for i, paragraph in enumerate(paragraphs):
-                if len(paragraph.strip()) > 100:  # Only substantial paragraphs
-                    sections.append({
-                        "title": f"Paragraph {i+1}",
-                        "content": paragraph.strip(),
-                        "word_count": len(paragraph.split())
-                    })
-        
-        return sections
-    
-    def _is_formatting_artifact(self, title: str, content: str) -> bool:
-        """
-        Check if a section is likely a formatting artifact rather than actual contract content.
-        """
-        title_lower = title.lower()
-        content_lower = content.lower()
-        
-        # Skip common non-contract sections
-        artifact_indicators = [
-            "summary", "analysis", "review", "note", "disclaimer", "generated", 
-            "created", "overview", "introduction", "conclusion", "appendix",
-            "table of contents", "index", "header", "footer"
-        ]
-        
-        if any(indicator in title_lower for indicator in artifact_indicators):
-            return True
-        
-        # Skip sections that are mostly formatting
-        if len(content.strip()) < 20:
-            return True
-        
-        # Skip sections with too many special characters (likely formatting)
-        special_char_ratio = sum(1 for c in content if not c.isalnum() and not c.isspace()) / len(content)
-        if special_char_ratio > 0.3:
-            return True
-        
-        return False
-    
+    def _prepare_contract(self, contract_text: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Preprocess the contract and analyze its metadata, reusing earlier results for identical text.
+        Re-uploads of the same document skip the regex cleanup, section extraction and keyword scans.
+        The cached metadata is shared between requests and must be treated as read-only.
+        """
+        text_hash = blake2b(contract_text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        cache = self._prepared_contract_cache
+        with self._prepared_contract_lock:
+            prepared = cache.get(text_hash)
+            if prepared is not None:
+                cache.move_to_end(text_hash)
+        if prepared is not None:
+            logger.info("Reusing cached preprocessing and metadata for previously analyzed contract")
+            return prepared
+        
+        cleaned_contract = self._preprocess_contract_text(contract_text)
+        prepared = (cleaned_contract, self._analyze_contract_metadata(cleaned_contract))
+        with self._prepared_contract_lock:
+            cache[text_hash] = prepared
+            if len(cache) > _PREPARED_CONTRACT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return prepared
+
     def _get_granite_analysis_with_context(self, contract_text: str, metadata: Dict[str, Any], 
                                          compliance_checklist: Dict[str, Any], jurisdiction: str) -> str:
         """
@@ -349,9 +936,8 @@ class ContractAnalyzerService:
             logger.info("Engaging IBM Granite model for advanced legal analysis")
             
             # Use the enhanced prompt designed for Granite
-            granite_response = self.watsonx_client.analyze_contract(
-                contract_text=contract_text,
-                compliance_checklist=compliance_checklist
+            granite_response = self._request_granite_analysis(
+                contract_text, compliance_checklist, jurisdiction, metadata['type']
             )
             
             logger.info(f"IBM Granite analysis completed successfully: {len(granite_response)} characters")
@@ -374,46 +960,54 @@ class ContractAnalyzerService:
             logger.error(f"Unexpected error with IBM Granite: {e}")
             return self._get_intelligent_mock_analysis(contract_text, metadata, compliance_checklist, jurisdiction)
     
-    def _build_enhanced_granite_prompt(self, contract_text: str, metadata: Dict[str, Any], jurisdiction: str) -> str:
+    def _request_granite_analysis(self, contract_text: str, compliance_checklist: Dict[str, Any],
+                                  jurisdiction: str, contract_type: str) -> str:
         """
-        Build an intelligent prompt for Granite that focuses on actual contract content.
+        Get Granite's raw analysis, reusing a recent response for the same contract and checklist.
+        The checklist is determined by the jurisdiction and contract type, so those key the cache.
         """
-        jurisdiction_name = {
-            "MY": "Malaysia", "SG": "Singapore", "EU": "European Union", "US": "United States"
-        }.get(jurisdiction, jurisdiction)
-        
-        prompt = f"""Analyze this {metadata['type']} contract for {jurisdiction_name} compliance.
-
-CONTRACT CONTEXT:
-- Type: {metadata['type']} contract
-- Word Count: {metadata['word_count']} words
-- Sections Identified: {len(metadata['sections'])}
-- Data Processing Elements: {'Yes' if metadata['has_data_processing'] else 'No'}
-- Termination Clauses: {'Yes' if metadata['has_termination_clauses'] else 'No'}
-- Payment Terms: {'Yes' if metadata['has_payment_terms'] else 'No'}
-
-ANALYSIS REQUIREMENTS:
-1. Focus ONLY on actual contract clauses, ignore any headers, titles, or formatting
-2. For flagged clauses, extract the EXACT clause text that has the issue
-3. Only flag issues that are contextually relevant to the specific clause content
-4. Provide jurisdiction-specific compliance analysis for {jurisdiction_name}
-
-IMPORTANT: Do not flag issues on section headers, markdown formatting, or non-contractual text.
-Only analyze substantive contractual provisions and obligations.
-
-Return analysis in JSON format with summary, flagged_clauses, and compliance_issues arrays."""
+        cache_key = (
+            blake2b(contract_text.encode("utf-8", "surrogatepass"), digest_size=16).digest(),
+            jurisdiction,
+            contract_type
+        )
+        cache = self._granite_response_cache
+        with self._granite_response_lock:
+            cached = cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < _GRANITE_RESPONSE_TTL_SECONDS:
+                cache.move_to_end(cache_key)
+                logger.info("Reusing recent IBM Granite response for identical contract")
+                return cached[1]
+        
+        granite_response = self.watsonx_client.analyze_contract(
+            contract_text=contract_text,
+            compliance_checklist=compliance_checklist
+        )
         
-        return prompt
+        with self._granite_response_lock:
+            cache[cache_key] = (time.monotonic(), granite_response)
+            cache.move_to_end(cache_key)
+            if len(cache) > _GRANITE_RESPONSE_CACHE_SIZE:
+                cache.popitem(last=False)
+        return granite_response
     
     def _get_intelligent_mock_analysis(self, contract_text: str, metadata: Dict[str, Any], 
                                      compliance_checklist: Dict[str, Any], jurisdiction: str) -> str:
         """
+        Intelligent mock analysis serialized as JSON, for callers that must return raw AI response text.
+        """
+        return json_dumps(self._build_analysis_dict(contract_text, metadata, compliance_checklist, jurisdiction))
+    
+    def _build_analysis_dict(self, contract_text: str, metadata: Dict[str, Any], 
+                             compliance_checklist: Dict[str, Any], jurisdiction: str) -> Dict[str, Any]:
+        """
         Intelligent mock analysis that adapts to the specific contract content and avoids repetitive outputs.
         Enhanced for IBM Granite compatibility with rigorous legal analysis.
+        Returns the analysis as a dict so in-process callers can skip a JSON round-trip.
         """
         flagged_clauses = []
         compliance_issues = []
-        seen_issues = set()  # Track unique issues to prevent duplicates
+        seen_issues: Set[Tuple[str, str]] = set()  # Track unique issues to prevent duplicates
         
         logger.info(f"Starting rigorous intelligent analysis for {metadata['type']} contract with {len(metadata['sections'])} sections")
         
@@ -424,7 +1018,7 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
         
         # Extract unique flagged clauses with strict criteria
         for issue in contract_analysis.get('flagged_clauses', []):
-            issue_key = f"{issue['issue'][:50]}_{issue['severity']}"  # Create unique key
+            issue_key = (issue['issue'][:50], issue['severity'])  # Create unique key
             if issue_key not in seen_issues and self._is_substantive_legal_issue(issue, contract_text):
                 seen_issues.add(issue_key)
                 flagged_clauses.append(issue)
@@ -447,99 +1041,11 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
         
         logger.info(f"Rigorous analysis complete: {len(flagged_clauses)} unique flagged clauses, {len(compliance_issues)} compliance issues")
         
-        return json.dumps({
+        return {
             "summary": summary,
             "flagged_clauses": flagged_clauses,
             "compliance_issues": compliance_issues
-        })
-    
-    def _analyze_section_intelligently(self, section: Dict[str, str], metadata: Dict[str, Any], 
-                                     jurisdiction: str) -> List[Dict[str, Any]]:
-        """
-        Intelligent section analysis that only flags relevant issues on appropriate content.
-        """
-        issues = []
-        title = section['title'].lower()
-        content = section['content'].lower()
-        
-        # Only analyze if this is substantial contract content
-        if section['word_count'] < 10:
-            return issues
-        
-        # Employment-specific analysis
-        if metadata['type'] == 'Employment':
-            if 'termination' in title or 'termination' in content:
-                if 'without notice' in content and 'misconduct' not in content:
-                    issues.append({
-                        "clause_text": self._extract_relevant_clause(section['content'], 'without notice'),
-                        "issue": f"Termination without notice may not comply with {jurisdiction} employment law minimum notice requirements",
-                        "severity": "high"
-                    })
-                
-                # Check for inadequate notice periods
-                notice_match = re.search(r'(\d+)\s*(day|week|month)', content)
-                if notice_match:
-                    notice_period = int(notice_match.group(1))
-                    period_type = notice_match.group(2)
-                    
-                    if period_type == 'day' and notice_period < 7:
-                        issues.append({
-                            "clause_text": self._extract_relevant_clause(section['content'], notice_match.group(0)),
-                            "issue": f"Notice period of {notice_period} days may be insufficient under {jurisdiction} employment standards",
-                            "severity": "medium"
-                        })
-            
-            if ('wage' in content or 'salary' in content) and 'overtime' not in content:
-                issues.append({
-                    "clause_text": self._extract_relevant_clause(section['content'], 'wage salary'),
-                    "issue": f"Compensation clause lacks overtime provisions required under {jurisdiction} employment law",
-                    "severity": "medium"
-                })
-        
-        # Data processing analysis (only for contracts that actually process data)
-        if metadata['has_data_processing'] and ('data' in content or 'information' in content):
-            if 'personal data' in content and 'consent' not in content:
-                issues.append({
-                    "clause_text": self._extract_relevant_clause(section['content'], 'personal data'),
-                    "issue": f"Data processing clause lacks explicit consent mechanisms required under {jurisdiction} privacy law",
-                    "severity": "high"
-                })
-        
-        # Liability analysis
-        if 'liability' in content or 'damages' in content:
-            # Look for liability caps that might be too low
-            amount_match = re.search(r'(\d+(?:,\d+)*)', content)
-            if amount_match:
-                amount = int(amount_match.group(1).replace(',', ''))
-                if 'liability' in content and amount < 10000:
-                    issues.append({
-                        "clause_text": self._extract_relevant_clause(section['content'], amount_match.group(0)),
-                        "issue": f"Liability limitation of {amount} may be insufficient for this type of contract",
-                        "severity": "low"
-                    })
-        
-        return issues
-    
-    def _extract_relevant_clause(self, section_content: str, search_terms: str) -> str:
-        """
-        Extract the most relevant sentence or clause that contains the search terms.
-        """
-        sentences = re.split(r'[.!?]+', section_content)
-        
-        # Find the sentence containing the search terms
-        for sentence in sentences:
-            if any(term.lower() in sentence.lower() for term in search_terms.split()):
-                clean_sentence = sentence.strip()
-                if len(clean_sentence) > 10:
-                    return clean_sentence + "."
-        
-        # Fallback: return first substantial sentence
-        for sentence in sentences:
-            if len(sentence.strip()) > 20:
-                return sentence.strip() + "."
-        
-        # Last resort: return truncated content
-        return section_content[:150] + "..." if len(section_content) > 150 else section_content
+        }
     
     def _generate_smart_compliance_issues(self, contract_text: str, metadata: Dict[str, Any], 
                                         jurisdiction: str) -> List[Dict[str, Any]]:
@@ -549,7 +1055,7 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
         Only generates issues for laws that are actually applicable to the contract and jurisdiction.
         """
         issues = []
-        text_lower = contract_text.lower()
+        text_lower = metadata.get('text_lower') or contract_text.lower()
         
         logger.info(f"Generating compliance issues for {metadata['type']} contract in {jurisdiction} jurisdiction")
         
@@ -557,34 +1063,35 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
         if metadata['type'] == 'Employment' and jurisdiction == 'MY':
             requirements = []
             recommendations = []
+            # Checks whose literals the metadata scan did not find skip their regex entirely
+            found_phrases = metadata.get('found_phrases')
             
             # Enhanced Employment Act 1955 compliance checks
             
             # 1. Termination notice provisions (Section 12)
-            notice_found = re.search(r'(?:notice|termination).*(?:\d+.*(?:week|month|day))', text_lower)
+            notice_found = _EA_NOTICE_RE.search(text_lower, found_phrases)
             if not notice_found:
                 requirements.append("Termination notice provisions do not meet Employment Act 1955 Section 12 minimum requirements")
                 recommendations.append("Add termination clause specifying minimum notice: 2 weeks for <2 years service, 4 weeks for >2 years service")
             
             # 2. Working hours limitations (Section 60A)
             hours_violation = False
-            hours_matches = re.finditer(r'(\d+).*hours?.*(?:per|each).*(?:day|week)', text_lower)
+            hours_matches = _EA_HOURS_RE.finditer(text_lower, found_phrases)
             for match in hours_matches:
-                hours = int(match.group(1))
-                period = match.group(0)
-                if ('day' in period and hours > 8) or ('week' in period and hours > 48):
+                hours = int(match['hours'])
+                if hours > (8 if match['unit'] == 'day' else 48):
                     hours_violation = True
                     requirements.append(f"Working hours exceed Employment Act 1955 Section 60A maximum (8 hours/day, 48 hours/week)")
                     recommendations.append("Adjust working hours to comply with statutory maximums under Section 60A")
                     break
             
             # 3. Overtime compensation (Section 60A)
-            if not re.search(r'overtime.*(?:compensation|payment|rate|1\.5|time.*half)', text_lower):
+            if not (_EA_OVERTIME_RE.search(text_lower, found_phrases)):
                 requirements.append("Missing overtime compensation violates Employment Act 1955 Section 60A")
                 recommendations.append("Include overtime payment at minimum 1.5x normal hourly rate as mandated by Section 60A")
             
             # 4. Annual leave entitlement (Section 60E)
-            leave_found = re.search(r'annual.*leave.*(\d+).*day|(\d+).*day.*annual.*leave', text_lower)
+            leave_found = _EA_ANNUAL_LEAVE_RE.search(text_lower, found_phrases)
             if not leave_found:
                 requirements.append("Missing annual leave entitlement violates Employment Act 1955 Section 60E")
                 recommendations.append("Specify annual leave entitlement: 8 days (<2 years), 12 days (2-5 years), 16 days (>5 years)")
@@ -596,12 +1103,12 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
                     recommendations.append("Increase annual leave to statutory minimum of 8 days as required by Section 60E")
             
             # 5. Rest days and public holidays (Sections 60C, 60D)
-            if not re.search(r'rest.*day|public.*holiday|gazetted.*holiday', text_lower):
+            if not (_EA_REST_DAY_RE.search(text_lower, found_phrases)):
                 requirements.append("Missing rest day and public holiday provisions required under Employment Act 1955 Sections 60C, 60D")
                 recommendations.append("Include provisions for weekly rest days and gazetted public holidays as mandated")
             
             # 6. Probation period limits (Section 11)
-            probation_match = re.search(r'probation.*(\d+).*month|(\d+).*month.*probation', text_lower)
+            probation_match = _EA_PROBATION_RE.search(text_lower, found_phrases)
             if probation_match:
                 probation_months = int(probation_match.group(1) or probation_match.group(2))
                 if probation_months > 6:
@@ -609,7 +1116,7 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
                     recommendations.append("Reduce probation period to maximum 6 months as required by Section 11")
             
             # 7. Minimum wage compliance
-            salary_matches = re.finditer(r'salary.*rm\s*(\d+(?:,\d+)*)|rm\s*(\d+(?:,\d+)*).*salary', text_lower)
+            salary_matches = _EA_SALARY_RE.finditer(text_lower, found_phrases)
             for match in salary_matches:
                 salary_str = (match.group(1) or match.group(2)).replace(',', '')
                 salary_amount = int(salary_str)
@@ -619,11 +1126,11 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
                     break
             
             # 8. EPF and SOCSO contributions
-            if not re.search(r'epf|employees.*provident.*fund', text_lower):
+            if not (_EA_EPF_RE.search(text_lower, found_phrases)):
                 requirements.append("Missing EPF contribution provisions required under EPF Act 1991")
                 recommendations.append("Include EPF contribution clause (11% employee, 12-13% employer)")
             
-            if not re.search(r'socso|social.*security|employment.*injury', text_lower):
+            if not (_EA_SOCSO_RE.search(text_lower, found_phrases)):
                 requirements.append("Missing SOCSO contribution provisions required under SOCSO Act 1969")
                 recommendations.append("Include SOCSO contribution clause for employment injury and invalidity coverage")
             
@@ -638,42 +1145,30 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
         # Data protection compliance (only for contracts that actually process personal data)
         if metadata['has_data_processing']:
             # Determine the correct data protection law based on jurisdiction
-            law_mapping = {
-                "MY": "PDPA_MY",
-                "SG": "PDPA_SG", 
-                "EU": "GDPR_EU",
-                "US": "CCPA_US"
-            }
-            
-            law_id = law_mapping.get(jurisdiction)
+            law_id = _DATA_PROTECTION_LAWS.get(jurisdiction)
             if not law_id:
                 logger.warning(f"No data protection law defined for jurisdiction '{jurisdiction}'")
                 return issues
             
-            law_name = {
-                "MY": "Personal Data Protection Act 2010", 
-                "SG": "Personal Data Protection Act 2012", 
-                "EU": "GDPR", 
-                "US": "CCPA"
-            }.get(jurisdiction, "privacy law")
+            law_name = _DATA_PROTECTION_LAW_NAMES.get(jurisdiction, "privacy law")
             
             requirements = []
             recommendations = []
             
             # Critical data protection violations only
-            if not re.search(r'consent.*(?:explicit|written|informed)', text_lower):
+            if not _CONSENT_RE.search(text_lower):
                 requirements.append(f"Missing explicit consent mechanisms required under {law_name}")
                 recommendations.append(f"Implement clear, informed consent procedures before collecting personal data")
             
-            if jurisdiction in ['MY', 'SG'] and not re.search(r'data subject.*rights', text_lower):
+            if jurisdiction in ['MY', 'SG'] and not _DATA_SUBJECT_RIGHTS_RE.search(text_lower):
                 requirements.append(f"Missing data subject rights provisions required under {law_name}")
                 recommendations.append("Include data subject rights: access, correction, and withdrawal of consent")
             
-            if jurisdiction == 'EU' and not re.search(r'(?:access|rectification|erasure|portability)', text_lower):
+            if jurisdiction == 'EU' and not _GDPR_RIGHTS_RE.search(text_lower):
                 requirements.append("Missing GDPR data subject rights (access, rectification, erasure, portability)")
                 recommendations.append("Implement all GDPR data subject rights as mandated by Articles 15-20")
             
-            if jurisdiction == 'US' and not re.search(r'(?:consumer.*rights|privacy.*rights|opt.*out)', text_lower):
+            if jurisdiction == 'US' and not _CONSUMER_RIGHTS_RE.search(text_lower):
                 # Enhanced CCPA-specific violation detection
                 requirements, recommendations = self._detect_ccpa_violations(contract_text, text_lower)
                 if requirements:
@@ -708,9 +1203,7 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
         """
         Generate a contextual summary based on the specific contract and findings.
         """
-        jurisdiction_name = {
-            "MY": "Malaysia", "SG": "Singapore", "EU": "European Union", "US": "United States"
-        }.get(jurisdiction, jurisdiction)
+        jurisdiction_name = _JURISDICTION_NAMES.get(jurisdiction, jurisdiction)
         
         total_issues = len(flagged_clauses) + len(compliance_issues)
         contract_type = metadata['type']
@@ -766,7 +1259,7 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
             "compliance_issues": []
         }
 
-    async def calculate_risk_score(self, analysis_response: ContractAnalysisResponse) -> ComplianceRiskScore:
+    def calculate_risk_score(self, analysis_response: ContractAnalysisResponse) -> ComplianceRiskScore:
             """
             Calculate comprehensive risk scoring with proper weighting for severity and violations.
             Uses IBM Granite AI for enhanced risk assessment when available.
@@ -780,51 +1273,27 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
             risk_deductions = 0
             
             # Analyze compliance issues with proper weighting
-            for issue in analysis_response.compliance_issues or []:
+            compliance_issues = analysis_response.compliance_issues or []
+            for issue in compliance_issues:
                 violation_categories.add(issue.law)
                 
-                # Calculate law-specific risk
-                law_risk = self._get_risk_from_law(issue.law, len(issue.missing_requirements))
+                law_risk, deduction = self._score_compliance_issue(issue.law, len(issue.missing_requirements))
                 financial_risk += law_risk
-                
-                # Deduct points based on number of missing requirements
-                missing_count = len(issue.missing_requirements)
-                
-                # CCPA violations are scored more severely due to strict liability
-                if issue.law == "CCPA_US":
-                    if missing_count >= 5:
-                        risk_deductions += 40  # Critical CCPA violations
-                    elif missing_count >= 3:
-                        risk_deductions += 30  # Severe CCPA violations
-                    elif missing_count >= 2:
-                        risk_deductions += 20  # Moderate CCPA violations
-                    else:
-                        risk_deductions += 12  # Minor CCPA violations
-                else:
-                    # Standard scoring for other laws
-                    if missing_count >= 4:
-                        risk_deductions += 25  # Severe compliance gaps
-                    elif missing_count >= 2:
-                        risk_deductions += 15  # Moderate compliance gaps
-                    else:
-                        risk_deductions += 8   # Minor compliance gaps
-                
-                jurisdiction = analysis_response.jurisdiction or "MY"
-                jurisdiction_risks[jurisdiction] = jurisdiction_risks.get(jurisdiction, 0) + law_risk
+                risk_deductions += deduction
             
-            # Analyze flagged clauses with severity weighting
-            for clause in analysis_response.flagged_clauses or []:
-                severity = getattr(clause, 'severity', 'medium')
-                
-                if severity == 'high':
-                    risk_deductions += 20
-                    financial_risk += 15000
-                elif severity == 'medium':
-                    risk_deductions += 12
-                    financial_risk += 8000
-                else:  # low severity
-                    risk_deductions += 5
-                    financial_risk += 3000
+            # Every issue belongs to the response's jurisdiction, so its risk is the issue total so far
+            if compliance_issues:
+                jurisdiction_risks[analysis_response.jurisdiction or "MY"] = financial_risk
+            
+            # Analyze flagged clauses with severity weighting; anything not high or medium counts as low
+            flagged_clauses = analysis_response.flagged_clauses or []
+            severity_counts = Counter(getattr(clause, 'severity', 'medium') for clause in flagged_clauses)
+            high_count = severity_counts['high']
+            medium_count = severity_counts['medium']
+            low_count = len(flagged_clauses) - high_count - medium_count
+            
+            risk_deductions += 20 * high_count + 12 * medium_count + 5 * low_count
+            financial_risk += 15000 * high_count + 8000 * medium_count + 3000 * low_count
             
             # Calculate final risk score (capped at 0-100)
             final_score = max(0, min(100, base_risk_score - risk_deductions))
@@ -846,17 +1315,22 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
                 jurisdiction_risks=jurisdiction_risks
             )
     
-    def _get_risk_from_law(self, law_id: str, violation_count: int) -> float:
-        """Calculate financial risk based on law type and violation severity."""
-        base_risks = {
-            "EMPLOYMENT_ACT_MY": 12000,
-            "PDPA_MY": 20000,
-            "PDPA_SG": 25000,
-            "GDPR_EU": 50000,
-            "CCPA_US": 75000  # Increased base risk for CCPA due to $7,500 per violation penalty
-        }
+    def _score_compliance_issue(self, law_id: str, missing_count: int) -> Tuple[float, int]:
+        """Return the financial risk and score deduction for one compliance issue."""
+        # Calculate law-specific risk
+        law_risk = self._get_risk_from_law(law_id, missing_count)
         
-        base_risk = base_risks.get(law_id, 10000)
+        # Deduct points based on number of missing requirements
+        deductions = _CCPA_RISK_DEDUCTIONS if law_id == "CCPA_US" else _STANDARD_RISK_DEDUCTIONS
+        deduction = deductions[min(missing_count, len(deductions) - 1)]
+        
+        return law_risk, deduction
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _get_risk_from_law(law_id: str, violation_count: int) -> float:
+        """Calculate financial risk based on law type and violation severity."""
+        base_risk = _LAW_BASE_RISKS.get(law_id, 10000)
         
         # CCPA has particularly harsh penalties - scale more aggressively
         if law_id == "CCPA_US":
@@ -870,70 +1344,57 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
         This is the key fix to prevent markdown headers from being analyzed as contract clauses.
         """
         # Step 1: Remove markdown headers completely (these are NOT contract content)
-        text = re.sub(r'^#{1,6}\s+.*$', '', contract_text, flags=re.MULTILINE)
+        text = _MD_HEADER_RE.sub('', contract_text) if '#' in contract_text else contract_text
         
-        # Step 2: Remove markdown formatting but keep the content
-        text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)  # Bold
-        text = re.sub(r'\*(.*?)\*', r'\1', text)      # Italic
-        text = re.sub(r'`(.*?)`', r'\1', text)        # Code spans
+        # Step 2: Remove markdown formatting but keep the content. Text extracted from PDF and
+        # Word uploads rarely contains the marker characters, so a substring check skips the passes
+        if '*' in text:
+            text = _MD_BOLD_RE.sub(r'\1', text)  # Bold
+            text = _MD_ITALIC_RE.sub(r'\1', text)  # Italic
+        if '`' in text:
+            text = _MD_CODE_RE.sub(r'\1', text)  # Code spans
         
         # Step 3: Remove markdown list markers that aren't part of contract content
-        text = re.sub(r'^\s*[-*+]\s+', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^\s*\d+\.\s+(?=[A-Z])', '', text, flags=re.MULTILINE)
+        text = _MD_LIST_MARKER_RE.sub('', text)
+        text = _MD_NUMBERED_MARKER_RE.sub('', text)
         
         # Step 4: Remove HTML tags if present
-        text = re.sub(r'<[^>]+>', '', text)
+        if '<' in text:
+            text = _HTML_TAG_RE.sub('', text)
         
         # Step 5: Remove common document metadata and non-contract content
-        non_contract_patterns = [
-            r'(?i)^(contract analysis|legal review|summary|overview|analysis|review):.*$',
-            r'(?i)^(note|disclaimer|warning|important):.*$',
-            r'(?i)^(created by|generated by|analyzed by|document|title):.*$',
-            r'(?i)^(version|date|status|author):.*$',
-            r'(?i)^(page \d+|header|footer):.*$',
-            r'(?i)^\s*(summary|conclusion|recommendations?):\s*$',  # Section headers only
-            r'(?i)^\s*-{3,}\s*$',  # Markdown dividers
-            r'(?i)^\s*={3,}\s*$',  # Underlines
-        ]
-        
-        for pattern in non_contract_patterns:
-            text = re.sub(pattern, '', text, flags=re.MULTILINE)
-        
-        # Step 6: Clean up whitespace but preserve paragraph structure
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)  # Multiple newlines to double
-        text = re.sub(r'[ \t]+', ' ', text)              # Multiple spaces to single
-        text = re.sub(r'^\s+', '', text, flags=re.MULTILINE)  # Leading whitespace
-        
-        # Step 7: Remove lines that are clearly formatting artifacts or too short to be meaningful
-        lines = text.split('\n')
+        text = _NON_CONTRACT_LINES_RE.sub('', text)
+        
+        # Step 6: Collapse runs of spaces and tabs inside lines
+        text = _SPACE_RUN_RE.sub(' ', text)
+        
+        # Step 7: One pass over the lines strips surrounding whitespace, drops blank lines and
+        # removes lines that are clearly formatting artifacts or too short to be meaningful
         meaningful_lines = []
         
-        for line in lines:
+        for line in text.split('\n'):
             line = line.strip()
-            if not line:
-                meaningful_lines.append('')  # Preserve paragraph breaks
+            # Blank lines and lines too short to be meaningful
+            line_length = len(line)
+            if line_length < 10:
                 continue
                 
             # Skip lines that are clearly not contract content
-            if (len(line) < 10 or  # Too short
-                line.isupper() and len(line.split()) < 5 or  # Short ALL CAPS (likely headers)
-                re.match(r'^[^\w]*$', line) or  # Only special characters
-                re.match(r'^(page|section|article|chapter)\s*\d+\s*$', line, re.IGNORECASE) or  # Page/section numbers
-                line.count('_') > len(line) // 3 or  # Too many underscores (formatting)
-                line.count('-') > len(line) // 3):   # Too many dashes (formatting)
+            formatting_limit = line_length // 3
+            if (line.isupper() and len(line.split()) < 5 or  # Short ALL CAPS (likely headers)
+                _FORMATTING_LINE_RE.match(line) or  # Only special characters or page/section numbers
+                line.count('_') > formatting_limit or  # Too many underscores (formatting)
+                line.count('-') > formatting_limit):   # Too many dashes (formatting)
                 continue
             
             meaningful_lines.append(line)
         
+        # Step 8: Lines are stripped and non-empty, so the joined text needs no further cleanup
         text = '\n'.join(meaningful_lines)
         
-        # Step 8: Final cleanup
-        text = text.strip()
-        text = re.sub(r'\n{3,}', '\n\n', text)  # No more than double newlines
-        
         # Step 9: Validation - if text is too short after cleaning, it might not be a real contract
-        if len(text.strip()) < 100:
-            logger.warning(f"Contract text appears to be very short after preprocessing: {len(text.strip())} characters")
+        if len(text) < 100:
+            logger.warning(f"Contract text appears to be very short after preprocessing: {len(text)} characters")
         
         logger.info(f"Text preprocessing complete. Removed formatting artifacts. Clean text length: {len(text)}")
         return text
@@ -945,124 +1406,43 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
         """
         text_lower = contract_text.lower()
         
+        # Find every type, content and jurisdiction keyword that occurs, in one scan where possible
+        found_phrases = _find_metadata_phrases(text_lower)
+        
         # Enhanced contract type detection with more sophisticated analysis
         contract_type = "General"
-        type_scores = {}
-        
-        type_indicators = {
-            "Employment": {
-                "strong": ["employee", "employer", "employment", "position", "job duties", "workplace", "termination of employment"],
-                "moderate": ["salary", "wage", "work schedule", "benefits", "leave", "resignation"],
-                "weak": ["work", "duties", "responsibilities"]
-            },
-            "Service": {
-                "strong": ["service provider", "client", "deliverables", "scope of work", "statement of work"],
-                "moderate": ["services", "performance", "completion", "milestone"],
-                "weak": ["provide", "deliver", "complete"]
-            },
-            "Privacy": {
-                "strong": ["privacy policy", "privacy notice", "california consumer privacy act", "ccpa", "personal information collection", "privacy rights"],
-                "moderate": ["personal information", "data collection", "consumer rights", "privacy", "california resident"],
-                "weak": ["collect", "information", "data"]
-            },
-            "NDA": {
-                "strong": ["non-disclosure", "confidentiality agreement", "trade secret", "proprietary information"],
-                "moderate": ["confidential", "proprietary", "confidentiality"],
-                "weak": ["information", "disclosure"]
-            },
-            "Rental": {
-                "strong": ["landlord", "tenant", "lease agreement", "rental agreement", "premises"],
-                "moderate": ["rent", "lease", "property", "occupancy"],
-                "weak": ["monthly", "deposit"]
-            },
-            "Sales": {
-                "strong": ["purchase agreement", "sale agreement", "buyer", "seller", "transfer of ownership"],
-                "moderate": ["purchase", "sale", "goods", "products", "delivery"],
-                "weak": ["buy", "sell", "payment"]
-            },
-            "Partnership": {
-                "strong": ["partnership agreement", "joint venture", "business partnership", "profit sharing"],
-                "moderate": ["partner", "partnership", "collaboration", "venture"],
-                "weak": ["together", "joint", "share"]
-            }
-        }
-        
-        # Calculate weighted scores for each contract type
-        for contract_type_candidate, indicators in type_indicators.items():
-            score = 0
-            
-            # Strong indicators (weight: 3)
-            for indicator in indicators["strong"]:
-                if indicator in text_lower:
-                    score += 3
-            
-            # Moderate indicators (weight: 2)
-            for indicator in indicators["moderate"]:
-                if indicator in text_lower:
-                    score += 2
-            
-            # Weak indicators (weight: 1)
-            for indicator in indicators["weak"]:
-                if indicator in text_lower:
-                    score += 1
-            
-            type_scores[contract_type_candidate] = score
-        
-        # Select the type with the highest score (minimum threshold of 3)
-        if type_scores:
-            best_type = max(type_scores, key=type_scores.get)
-            if type_scores[best_type] >= 3:
-                contract_type = best_type
-        
-        logger.info(f"Contract type analysis: {type_scores} -> Selected: {contract_type}")
-        
-        # Enhanced content analysis with better detection including California/CCPA specific content
-        has_data_processing = any(phrase in text_lower for phrase in [
-            "personal data", "data processing", "data protection", "privacy policy",
-            "data subject", "gdpr", "pdpa", "collect information", "process data",
-            "personal information", "california", "ccpa", "consumer rights", "privacy rights",
-            "collect personal", "share data", "sell data", "sale of personal information"
-        ])
-        
-        has_termination_clauses = any(phrase in text_lower for phrase in [
-            "termination", "terminate this", "end of contract", "contract expiry",
-            "cancellation", "breach of contract", "dissolution"
-        ])
-        
-        has_payment_terms = any(phrase in text_lower for phrase in [
-            "payment terms", "payment schedule", "compensation", "remuneration",
-            "salary", "wage", "fee", "amount due", "invoice"
-        ])
-        
-        has_liability_clauses = any(phrase in text_lower for phrase in [
-            "liability", "liable for", "damages", "indemnify", "indemnification",
-            "limitation of liability", "hold harmless", "responsibility for"
-        ])
-        
-        has_ip_clauses = any(phrase in text_lower for phrase in [
-            "intellectual property", "copyright", "patent", "trademark",
-            "work product", "invention", "proprietary rights", "trade secret"
-        ])
         
+        # Calculate weighted scores for each contract type from the keywords that were found
+        type_scores = Counter(dict.fromkeys(_TYPE_INDICATORS, 0))
+        for phrase in found_phrases:
+            for contract_type_candidate, weight in _TYPE_WEIGHTS_BY_KEYWORD.get(phrase, ()):
+                type_scores[contract_type_candidate] += weight
+        
+        # Select the type with the highest score (minimum threshold of 3); ties keep table order
+        best_type, best_score = type_scores.most_common(1)[0]
+        if best_score >= 3:
+            contract_type = best_type
+        
+        logger.info(f"Contract type analysis: {dict(type_scores)} -> Selected: {contract_type}")
+        
+        # Content flags, with better detection including California/CCPA specific content
+        has_data_processing = not found_phrases.isdisjoint(_CONTENT_FEATURE_PHRASES["has_data_processing"])
+        has_termination_clauses = not found_phrases.isdisjoint(_CONTENT_FEATURE_PHRASES["has_termination_clauses"])
+        has_payment_terms = not found_phrases.isdisjoint(_CONTENT_FEATURE_PHRASES["has_payment_terms"])
+        has_liability_clauses = not found_phrases.isdisjoint(_CONTENT_FEATURE_PHRASES["has_liability_clauses"])
+        has_ip_clauses = not found_phrases.isdisjoint(_CONTENT_FEATURE_PHRASES["has_ip_clauses"])
         # Extract meaningful sections with improved filtering
         sections = self._extract_contract_sections_only(contract_text)
         
         # Enhanced jurisdiction detection with CCPA-specific indicators
-        jurisdiction_indicators = {
-            "MY": ["malaysia", "malaysian", "kuala lumpur", "ringgit", "rm ", "employment act 1955", "companies act 2016"],
-            "SG": ["singapore", "singaporean", "sgd", "singapore dollar", "companies act singapore"],
-            "US": ["united states", "usd", "us dollar", "state of california", "state of new york", "delaware", "california", "ccpa", "california consumer privacy act", "california resident"],
-            "EU": ["european union", "gdpr", "euro", "eur", "brussels", "directive 95/46/ec"]
-        }
-        
         detected_jurisdictions = []
-        for jurisdiction, indicators in jurisdiction_indicators.items():
-            if any(indicator in text_lower for indicator in indicators):
+        for jurisdiction, indicators in _JURISDICTION_INDICATORS.items():
+            if not found_phrases.isdisjoint(indicators):
                 detected_jurisdictions.append(jurisdiction)
         
         # Calculate actual contract substance metrics
-        word_count = len([word for word in contract_text.split() if len(word) > 2])  # Exclude short words
-        sentence_count = len(re.findall(r'[.!?]+', contract_text))
+        word_count = sum(1 for word in contract_text.split() if len(word) > 2)  # Exclude short words
+        sentence_count = _count_sentence_ends(contract_text)
         
         # Determine if this is a substantial contract worth analyzing
         is_substantial = (
@@ -1084,7 +1464,9 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
             "detected_jurisdictions": detected_jurisdictions,
             "word_count": word_count,
             "sentence_count": sentence_count,
-            "is_substantial": is_substantial
+            "is_substantial": is_substantial,
+            "text_lower": text_lower,  # Shared with downstream helpers so the text is lowercased once
+            "found_phrases": frozenset(found_phrases)  # Lets the clause analysis skip patterns that cannot match
         }
         
         logger.info(f"Contract metadata analysis complete: {contract_type} contract with {len(sections)} substantive sections")
@@ -1098,47 +1480,34 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
         sections = []
         
         # Multiple patterns to detect genuine contract sections vs formatting
-        section_patterns = [
-            # Pattern 1: Numbered contract sections (e.g., "1. Definitions", "2.1 Scope")
-            r'\n\s*(\d+(?:\.\d+)*)\.\s+([A-Z][^.\n]{5,50}?)\s*\n((?:(?!\n\s*\d+(?:\.\d+)*\.)(?:[^\n]+\n?))*)',
-            
-            # Pattern 2: Lettered sections (e.g., "A. Terms", "B. Conditions")
-            r'\n\s*([A-Z])\.\s+([A-Z][^.\n]{5,50}?)\s*\n((?:(?!\n\s*[A-Z]\.)(?:[^\n]+\n?))*)',
-            
-            # Pattern 3: Named sections in contracts (e.g., "WHEREAS", "NOW THEREFORE")
-            r'\n\s*(WHEREAS|NOW THEREFORE|WITNESSETH|RECITALS?)\s*[,:]\s*\n((?:[^\n]+\n?)*?)(?=\n\s*(?:WHEREAS|NOW THEREFORE|WITNESSETH|\d+\.|[A-Z]{3,})|$)',
-            
-            # Pattern 4: Title case sections with substantial content
-            r'\n\s*([A-Z][a-z][^.\n]{10,80}?)\s*[:.]?\s*\n((?:[^\n]+\n?){3,}?)(?=\n\s*[A-Z][a-z][^.\n]{10,80}?[:.]?\s*\n|$)'
-        ]
-        
-        for pattern_idx, pattern in enumerate(section_patterns):
-            matches = list(re.finditer(pattern, contract_text, re.MULTILINE | re.DOTALL))
-            
-            for match in matches:
+        for pattern_idx, pattern in enumerate(_CONTRACT_SECTION_PATTERNS):
+            if pattern_idx == 2 and not any(keyword in contract_text for keyword in _RECITAL_KEYWORDS):
+                continue
+            for match in pattern.finditer(contract_text):
                 groups = match.groups()
                 
-                if len(groups) >= 2:
-                    if len(groups) == 3:
-                        section_id, title, content = groups
-                    else:
-                        title, content = groups
-                        section_id = f"Section {len(sections) + 1}"
-                    
-                    title = title.strip()
-                    content = content.strip()
-                    
-                    # Strict filtering for genuine contract content
-                    if self._is_genuine_contract_section(title, content):
-                        sections.append({
-                            "id": section_id,
-                            "title": title,
-                            "content": content,
-                            "word_count": len(content.split()),
-                            "pattern_used": pattern_idx + 1
-                        })
+                # Patterns capture either (id, title, content) or (title, content)
+                if len(groups) == 3:
+                    section_id, title, content = groups
+                else:
+                    title, content = groups
+                    section_id = f"Section {len(sections) + 1}"
+                
+                title = title.strip()
+                content = content.strip()
+                
+                # Strict filtering for genuine contract content
+                if word_count := self._genuine_contract_section_word_count(title, content):
+                    sections.append({
+                        "id": section_id,
+                        "title": title,
+                        "content": content,
+                        "word_count": word_count,
+                        "pattern_used": pattern_idx + 1
+                    })
             
-            # If we found good sections with one pattern, prioritize those
+            # If we found good sections with one pattern, prioritize those. The patterns are tried in
+            # order of how structured the headers are, so the order also decides which sections win
             if len(sections) >= 3:
                 break
         
@@ -1147,142 +1516,95 @@ Return analysis in JSON format with summary, flagged_clauses, and compliance_iss
             paragraphs = self._extract_meaningful_paragraphs(contract_text)
             sections.extend(paragraphs)
         
-        # Sort by appearance order and limit to most substantial sections
-        sections = sorted(sections, key=lambda x: x.get('word_count', 0), reverse=True)[:10]
+        # Limit to the most substantial sections; word_count is computed once per section above,
+        # so the key is a plain lookup and nlargest avoids sorting every candidate
+        sections = heapq.nlargest(10, sections, key=lambda x: x.get('word_count', 0))
         
         logger.info(f"Extracted {len(sections)} genuine contract sections for analysis")
         return sections
     
-    def _is_genuine_contract_section(self, title: str, content: str) -> bool:
+    def _genuine_contract_section_word_count(self, title: str, content: str) -> int:
         """
         Determine if a section is genuine contract content vs formatting artifact.
         This is the key method to prevent analysis of non-contractual content.
+        Returns the section's word count, or 0 if it is rejected, so callers don't split it again.
         """
         title_lower = title.lower()
-        content_lower = content.lower()
         
         # Immediately reject if title indicates non-contract content
-        non_contract_titles = [
-            "summary", "analysis", "review", "note", "disclaimer", "generated",
-            "created", "overview", "introduction", "conclusion", "appendix",
-            "table of contents", "index", "header", "footer", "document",
-            "title", "subject", "re:", "from:", "to:", "date:", "version",
-            "page", "confidential", "draft", "final", "approved"
-        ]
-        
-        if any(nc_title in title_lower for nc_title in non_contract_titles):
-            logger.debug(f"Rejected section '{title}' - contains non-contract title indicator")
-            return False
+        if any(nc_title in title_lower for nc_title in _NON_CONTRACT_TITLES):
+            logger.debug("Rejected section '%s' - contains non-contract title indicator", title)
+            return 0
         
         # Reject very short content (likely formatting)
-        if len(content.strip()) < 50:
-            logger.debug(f"Rejected section '{title}' - content too short ({len(content.strip())} chars)")
-            return False
+        if len(content.strip()) < _MIN_SECTION_CONTENT_CHARS:
+            logger.debug("Rejected section '%s' - content too short (%d chars)", title, len(content.strip()))
+            return 0
         
         # Reject content with too many special characters (formatting artifacts)
-        special_char_ratio = sum(1 for c in content if not c.isalnum() and not c.isspace()) / max(len(content), 1)
+        special_char_ratio = _count_special_chars(content) / max(len(content), 1)
         if special_char_ratio > 0.4:
-            logger.debug(f"Rejected section '{title}' - too many special characters ({special_char_ratio:.2f})")
-            return False
-        
-        # Reject if content is mostly uppercase (likely headers/formatting)
-        upper_ratio = sum(1 for c in content if c.isupper()) / max(len([c for c in content if c.isalpha()]), 1)
-        if upper_ratio > 0.7:
-            logger.debug(f"Rejected section '{title}' - mostly uppercase ({upper_ratio:.2f})")
-            return False
+            logger.debug("Rejected section '%s' - too many special characters (%.2f)", title, special_char_ratio)
+            return 0
         
         # Require minimum word count and sentence structure
         word_count = len(content.split())
-        sentence_count = len(re.findall(r'[.!?]+', content))
+        sentence_count = _count_sentence_ends(content)
         
         if word_count < 15 or sentence_count < 1:
-            logger.debug(f"Rejected section '{title}' - insufficient content (words: {word_count}, sentences: {sentence_count})")
-            return False
-        
-        # Positive indicators of contract content
-        contract_indicators = [
-            "party", "parties", "agreement", "contract", "shall", "will",
-            "hereby", "whereas", "therefore", "obligations", "rights",
-            "terms", "conditions", "provision", "clause", "section"
-        ]
+            logger.debug("Rejected section '%s' - insufficient content (words: %d, sentences: %d)", title, word_count, sentence_count)
+            return 0
         
-        indicator_count = sum(1 for indicator in contract_indicators if indicator in content_lower)
+        # Positive indicators of contract content. Lowercase the content only for sections that
+        # survived the cheaper structural checks
+        content_lower = content.lower()
+        indicator_count = sum(1 for indicator in _CONTRACT_LANGUAGE_INDICATORS if indicator in content_lower)
         if indicator_count < 2:
-            logger.debug(f"Rejected section '{title}' - insufficient contract indicators ({indicator_count})")
-            return False
+            logger.debug("Rejected section '%s' - insufficient contract indicators (%d)", title, indicator_count)
+            return 0
         
-        logger.debug(f"Accepted section '{title}' - genuine contract content (words: {word_count}, indicators: {indicator_count})")
-        return True
+        # Reject if content is mostly uppercase (likely headers/formatting). This per-character scan
+        # is the most expensive check, so it only runs once the cheaper checks have passed
+        upper_ratio = _uppercase_ratio(content)
+        if upper_ratio > 0.7:
+            logger.debug("Rejected section '%s' - mostly uppercase (%.2f)", title, upper_ratio)
+            return 0
+        
+        logger.debug("Accepted section '%s' - genuine contract content (words: %d, indicators: %d)", title, word_count, indicator_count)
+        return word_count
     
     def _extract_meaningful_paragraphs(self, contract_text: str) -> List[Dict[str, str]]:
         """
         Extract meaningful paragraphs when no clear sections are found.
         """
-        paragraphs = re.split(r'\n\s*\n\s*', contract_text)
+        paragraphs = _PARAGRAPH_BREAK_RE.split(contract_text)
         meaningful_paragraphs = []
         
         for i, paragraph in enumerate(paragraphs):
             paragraph = paragraph.strip()
             
-            if self._is_genuine_contract_section(f"Paragraph {i+1}", paragraph):
+            # Blank lines and headings between paragraphs are far more common than real clauses;
+            # drop them here rather than running the full validation on each one
+            if len(paragraph) < _MIN_SECTION_CONTENT_CHARS:
+                continue
+            
+            if word_count := self._genuine_contract_section_word_count(f"Paragraph {i+1}", paragraph):
                 meaningful_paragraphs.append({
                     "id": f"P{i+1}",
                     "title": f"Paragraph {i+1}",
                     "content": paragraph,
-                    "word_count": len(paragraph.split()),
+                    "word_count": word_count,
                     "pattern_used": 0  # Fallback pattern
                 })
         
         return meaningful_paragraphs
     
-    def _build_enhanced_granite_prompt(self, contract_text: str, metadata: Dict[str, Any], jurisdiction: str) -> str:
-        """
-        Build an enhanced prompt that prevents analysis of formatting artifacts.
-        """
-        jurisdiction_name = {
-            "MY": "Malaysia", "SG": "Singapore", "EU": "European Union", "US": "United States"
-        }.get(jurisdiction, jurisdiction)
-        
-        # Create content focus guidance
-        content_focus = f"""CRITICAL INSTRUCTION: ONLY analyze substantive contractual provisions. 
-
-IGNORE completely:
-- Document headers, titles, or section names
-- Markdown formatting (###, **, *, etc.)
-- Document metadata or analysis summaries
-- Any content that appears to be document formatting rather than contract terms
-
-ANALYZE only:
-- Actual contractual obligations and rights
-- Specific terms and conditions
-- Substantive legal provisions
-- Binding commitments between parties
-
-CONTRACT CONTEXT:
-- Type: {metadata['type']} contract (confidence: {metadata.get('type_confidence', 0)})
-- Substantive sections: {len([s for s in metadata['sections'] if s['word_count'] > 20])}
-- Contains data processing: {'Yes' if metadata['has_data_processing'] else 'No'}
-- Contains termination clauses: {'Yes' if metadata['has_termination_clauses'] else 'No'}
-- Contains payment terms: {'Yes' if metadata['has_payment_terms'] else 'No'}
-- Word count: {metadata['word_count']} meaningful words
-
-ANALYSIS REQUIREMENTS FOR {jurisdiction_name}:
-1. Extract ONLY the exact contractual clause text that has legal issues
-2. Focus on binding obligations, not descriptive text
-3. Identify specific legal non-compliance, not formatting issues
-4. Provide actionable legal recommendations
-5. Consider jurisdiction-specific requirements for {jurisdiction_name}
-
-OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues arrays."""
-        
-        return content_focus
-
     def _is_granite_response_minimal(self, response_text: str) -> bool:
         """
         Enhanced detection of minimal AI responses that need augmentation.
         """
         try:
-            response_json = json.loads(response_text)
+            response_json = json_loads(response_text)
             
             # Check for truly minimal responses
             flagged_count = len(response_json.get("flagged_clauses", []))
@@ -1302,9 +1624,12 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
             logger.warning("Could not parse AI response as JSON - treating as minimal")
             return True
     
-    def _clean_ai_response(self, ai_json: Dict[str, Any], jurisdiction: str, contract_text: str) -> Dict[str, Any]:
+    def _clean_ai_response(self, ai_json: Dict[str, Any], jurisdiction: str, contract_text: str,
+                           compliance_validated: bool = False) -> Dict[str, Any]:
         """
         Enhanced cleaning that removes any analysis of formatting artifacts and fixes malformed law fields.
+        Pass compliance_validated=True for locally generated analysis whose compliance issues were
+        already filtered by _validate_compliance_issues; only the flagged clauses are cleaned then.
         """
         cleaned_flagged = []
         cleaned_compliance = []
@@ -1315,81 +1640,19 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
             
             # Skip if clause is clearly a formatting artifact
             if not self._is_substantive_clause(clause_text):
-                logger.debug(f"Removing flagged clause - not substantive: {clause_text[:50]}...")
+                logger.debug("Removing flagged clause - not substantive: %.50s...", clause_text)
                 continue
             
             cleaned_flagged.append(flag)
         
-        # Clean compliance issues and fix malformed law fields
-        valid_laws = ["EMPLOYMENT_ACT_MY", "PDPA_MY", "PDPA_SG", "GDPR_EU", "CCPA_US"]
-        
-        for issue in ai_json.get("compliance_issues", []):
-            # Fix malformed law field (contains multiple laws separated by |)
-            law_field = issue.get("law", "")
-            
-            # CRITICAL: Block Malaysian Employment Act from being applied to US contracts
-            if jurisdiction == "US" and law_field == "EMPLOYMENT_ACT_MY":
-                logger.error(f"BLOCKED in AI cleaning: Malaysian Employment Act cannot be applied to US jurisdiction contract - removing issue")
-                continue
-            
-            # CRITICAL: Block any foreign employment law application
-            if law_field == "EMPLOYMENT_ACT_MY" and jurisdiction != "MY":
-                logger.error(f"BLOCKED in AI cleaning: Malaysian Employment Act cannot be applied to {jurisdiction} jurisdiction contract - removing issue")
-                continue
-            
-            if "|" in law_field:
-                # Split and take the first valid law based on jurisdiction and contract type
-                law_options = law_field.split("|")
-                fixed_law = self._select_appropriate_law(law_options, jurisdiction, ai_json)
-                issue["law"] = fixed_law
-                logger.warning(f"Fixed malformed law field: '{law_field}' -> '{fixed_law}'")
-            elif law_field not in valid_laws:
-                # Set appropriate law based on jurisdiction
-                issue["law"] = self._get_default_law_for_jurisdiction(jurisdiction)
-                logger.warning(f"Invalid law field '{law_field}' replaced with '{issue['law']}'")
-            
-            # Additional validation - ensure the final law is appropriate for jurisdiction
-            final_law = issue.get("law", "")
-            jurisdiction_laws = {
-                "MY": ["EMPLOYMENT_ACT_MY", "PDPA_MY"],
-                "SG": ["PDPA_SG"],
-                "EU": ["GDPR_EU"],
-                "US": ["CCPA_US"]
-            }
-            applicable_laws = jurisdiction_laws.get(jurisdiction, [])
-            
-            if final_law not in applicable_laws:
-                logger.error(f"BLOCKED in AI cleaning: Law '{final_law}' not applicable for jurisdiction '{jurisdiction}' - removing issue")
-                continue
-            # Clean up generic placeholder requirements
-            requirements = issue.get("missing_requirements", [])
-            cleaned_requirements = []
-            
-            for req in requirements:
-                if req and not self._is_generic_placeholder(req):
-                    cleaned_requirements.append(req)
-            
-            # If all requirements were generic, generate specific ones
-            if not cleaned_requirements:
-                cleaned_requirements = self._generate_specific_requirements(issue["law"], jurisdiction)
-            
-            issue["missing_requirements"] = cleaned_requirements
-            
-            # Clean up generic placeholder recommendations
-            recommendations = issue.get("recommendations", [])
-            cleaned_recommendations = []
-            
-            for rec in recommendations:
-                if rec and not self._is_generic_placeholder(rec):
-                    cleaned_recommendations.append(rec)
-            
-            # If all recommendations were generic, generate specific ones
-            if not cleaned_recommendations:
-                cleaned_recommendations = self._generate_specific_recommendations(issue["law"], jurisdiction)
-            
-            issue["recommendations"] = cleaned_recommendations
-            
-            cleaned_compliance.append(issue)
+        # Clean compliance issues and fix malformed law fields. Issues produced by the local analysis
+        # already went through _validate_compliance_issues, which enforces the same conditions
+        if compliance_validated:
+            cleaned_compliance = ai_json.get("compliance_issues", [])
+        else:
+            for issue in ai_json.get("compliance_issues", []):
+                if self._normalize_compliance_issue(issue, jurisdiction, ai_json):
+                    cleaned_compliance.append(issue)
         
         ai_json["flagged_clauses"] = cleaned_flagged
         ai_json["compliance_issues"] = cleaned_compliance
@@ -1397,31 +1660,69 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         logger.info(f"Response cleaning complete: {len(cleaned_flagged)} flagged clauses, {len(cleaned_compliance)} compliance issues retained")
         return ai_json
     
-    def _select_appropriate_law(self, law_options: List[str], jurisdiction: str, ai_json: Dict[str, Any]) -> str:
+    def _normalize_compliance_issue(self, issue: Dict[str, Any], jurisdiction: str, ai_json: Dict[str, Any]) -> bool:
         """
-        Select the most appropriate law from a list of options based on jurisdiction and contract context.
+        Fix the law field and placeholder content of an AI-reported compliance issue in place.
+        Returns False when the issue cites a law that cannot apply to the jurisdiction.
         """
-        # Priority mapping based on jurisdiction - avoid defaulting to employment law for non-employment contracts
-        jurisdiction_priority = {
-            "MY": ["PDPA_MY", "EMPLOYMENT_ACT_MY"],  # PDPA first, employment law only if specifically needed
-            "SG": ["PDPA_SG"],
-            "EU": ["GDPR_EU"],
-            "US": ["CCPA_US"]
-        }
+        # Fix malformed law field (contains multiple laws separated by |)
+        law_field = issue.get("law", "")
+        
+        # CRITICAL: Block Malaysian Employment Act from being applied to US contracts
+        if jurisdiction == "US" and law_field == "EMPLOYMENT_ACT_MY":
+            logger.error(f"BLOCKED in AI cleaning: Malaysian Employment Act cannot be applied to US jurisdiction contract - removing issue")
+            return False
         
-        # Get priority laws for jurisdiction
-        priority_laws = jurisdiction_priority.get(jurisdiction, [])
+        # CRITICAL: Block any foreign employment law application
+        if law_field == "EMPLOYMENT_ACT_MY" and jurisdiction != "MY":
+            logger.error(f"BLOCKED in AI cleaning: Malaysian Employment Act cannot be applied to {jurisdiction} jurisdiction contract - removing issue")
+            return False
         
-        # Find the first matching priority law
-        for priority_law in priority_laws:
+        if "|" in law_field:
+            # Split and take the first valid law based on jurisdiction and contract type
+            law_options = law_field.split("|")
+            fixed_law = self._select_appropriate_law(law_options, jurisdiction, ai_json)
+            issue["law"] = fixed_law
+            logger.warning("Fixed malformed law field: '%s' -> '%s'", law_field, fixed_law)
+        elif law_field not in _VALID_LAWS:
+            # Set appropriate law based on jurisdiction
+            issue["law"] = self._get_default_law_for_jurisdiction(jurisdiction)
+            logger.warning("Invalid law field '%s' replaced with '%s'", law_field, issue['law'])
+        
+        # Additional validation - ensure the final law is appropriate for jurisdiction
+        final_law = issue.get("law", "")
+        applicable_laws = _JURISDICTION_LAWS.get(jurisdiction, ())
+        
+        if final_law not in applicable_laws:
+            logger.error(f"BLOCKED in AI cleaning: Law '{final_law}' not applicable for jurisdiction '{jurisdiction}' - removing issue")
+            return False
+        
+        # Clean up generic placeholder requirements and recommendations; if all of them were
+        # generic, generate specific ones
+        issue["missing_requirements"] = (
+            [req for req in issue.get("missing_requirements", []) if req and not self._is_generic_placeholder(req)]
+            or self._generate_specific_requirements(issue["law"], jurisdiction)
+        )
+        issue["recommendations"] = (
+            [rec for rec in issue.get("recommendations", []) if rec and not self._is_generic_placeholder(rec)]
+            or self._generate_specific_recommendations(issue["law"], jurisdiction)
+        )
+        
+        return True
+    
+    def _select_appropriate_law(self, law_options: List[str], jurisdiction: str, ai_json: Dict[str, Any]) -> str:
+        """
+        Select the most appropriate law from a list of options based on jurisdiction and contract context.
+        """
+        # Find the first matching priority law for the jurisdiction
+        for priority_law in _JURISDICTION_LAW_PRIORITY.get(jurisdiction, ()):
             if priority_law in law_options:
                 return priority_law
         
         # Fallback: return first valid law option
-        valid_laws = ["EMPLOYMENT_ACT_MY", "PDPA_MY", "PDPA_SG", "GDPR_EU", "CCPA_US"]
         for law in law_options:
-            if law.strip() in valid_laws:
-                return law.strip()
+            if (candidate := law.strip()) in _VALID_LAWS:
+                return candidate
         
         # Last resort: default for jurisdiction
         return self._get_default_law_for_jurisdiction(jurisdiction)
@@ -1433,14 +1734,7 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         """
         # Data protection laws are generally applicable to most contracts
         # Employment laws should only be used for employment contracts specifically
-        defaults = {
-            "MY": "PDPA_MY",     # Changed from EMPLOYMENT_ACT_MY to prevent cross-application
-            "SG": "PDPA_SG", 
-            "EU": "GDPR_EU",
-            "US": "CCPA_US"
-        }
-        
-        default_law = defaults.get(jurisdiction)
+        default_law = _DATA_PROTECTION_LAWS.get(jurisdiction)
         
         if not default_law:
             logger.error(f"No default law found for jurisdiction '{jurisdiction}', this indicates a configuration issue")
@@ -1453,121 +1747,21 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         """
         Check if text is a generic placeholder that should be replaced.
         """
-        generic_phrases = [
-            "specific statutory requirements missing",
-            "specific actionable legal compliance steps",
-            "general compliance concern identified",
-            "review with legal counsel",
-            "statutory requirements missing",
-            "actionable legal compliance steps"
-        ]
-        
-        text_lower = text.lower()
-        return any(phrase in text_lower for phrase in generic_phrases)
+        return _contains_generic_placeholder(text.lower())
     
     def _generate_specific_requirements(self, law: str, jurisdiction: str) -> List[str]:
         """
         Generate specific missing requirements based on the law.
         Enhanced for comprehensive employment law compliance.
         """
-        requirements_map = {
-            "EMPLOYMENT_ACT_MY": [
-                "Termination notice provisions do not meet Employment Act 1955 Section 12 minimum requirements (2 weeks for <2 years service, 4 weeks for >2 years service)",
-                "Missing overtime compensation violates Employment Act 1955 Section 60A (minimum 1.5x normal hourly rate required)",
-                "Working hours may exceed Employment Act 1955 Section 60A maximum (8 hours/day, 48 hours/week)",
-                "Annual leave entitlement below Employment Act 1955 Section 60E minimum (8-16 days based on service length)",
-                "Probation period may exceed Employment Act 1955 Section 11 maximum of 6 months",
-                "Missing rest day and public holiday provisions required under Employment Act 1955 Sections 60C, 60D",
-                "Missing EPF contribution provisions required under EPF Act 1991 (11% employee, 12-13% employer)",
-                "Missing SOCSO contribution provisions required under SOCSO Act 1969",
-                "Salary may be below minimum wage requirement of RM1,500 under Minimum Wages Order 2022"
-            ],
-            "PDPA_MY": [
-                "Missing explicit consent mechanisms required under Personal Data Protection Act 2010",
-                "Lacks data subject rights provisions (access, correction, withdrawal) as mandated by PDPA 2010",
-                "Missing purpose limitation clauses required under PDPA 2010 Section 6",
-                "Insufficient data security safeguards as required under PDPA 2010 Section 7"
-            ],
-            "PDPA_SG": [
-                "Missing consent notification requirements under Singapore PDPA 2012",
-                "Lacks data protection officer designation as required by PDPA",
-                "Missing purpose specification and limitation under PDPA 2012"
-            ],
-            "GDPR_EU": [
-                "Missing lawful basis for processing personal data under GDPR Article 6",
-                "Lacks data subject rights implementation as required by GDPR Articles 15-22",
-                "Missing data protection impact assessment requirements under GDPR Article 35",
-                "Insufficient cross-border data transfer safeguards under GDPR Chapter V"
-            ],
-            "CCPA_US": [
-                "Missing Right to Correct personal information under CCPA § 1798.106",
-                "Missing Right to Limit Use of Sensitive Personal Information under CCPA § 1798.121", 
-                "Missing Right of Non-Discrimination under CCPA § 1798.125",
-                "Discriminatory practices for opt-out requests violate CCPA § 1798.125(a)",
-                "Inadequate contact methods - CCPA § 1798.130(a)(1) requires at least 2 methods including toll-free number",
-                "Response time violations - CCPA § 1798.130(a)(2) requires initial response within 45 days",
-                "Prohibited fee structure - CCPA § 1798.130(a)(2) prohibits charging consumers for exercising rights",
-                "Service provider violations - CCPA § 1798.140(ag) restricts service provider data use",
-                "Incomplete Notice at Collection missing CCPA-specific PI categories under § 1798.100(b)",
-                "Missing data sale disclosure and opt-out requirements under CCPA § 1798.115",
-                "Missing consumer privacy rights disclosure under CCPA Section 1798.100",
-                "Lacks opt-out mechanisms as required by California Consumer Privacy Act",
-                "Missing data sale disclosure requirements under CCPA Section 1798.115"
-            ]
-        }
-        
-        return requirements_map.get(law, ["Contract requires legal review for compliance"])
+        return list(_SPECIFIC_REQUIREMENTS.get(law, _DEFAULT_REQUIREMENTS))
     
     def _generate_specific_recommendations(self, law: str, jurisdiction: str) -> List[str]:
         """
         Generate specific recommendations based on the law.
         Enhanced for comprehensive employment law compliance.
         """
-        recommendations_map = {
-            "EMPLOYMENT_ACT_MY": [
-                "Add termination clause specifying minimum notice periods: 2 weeks for employees with <2 years service, 4 weeks for >2 years service as per Section 12",
-                "Include overtime payment clause requiring minimum 1.5x normal hourly rate as mandated by Section 60A",
-                "Specify working hours limits: maximum 8 hours per day and 48 hours per week as per Section 60A",
-                "Include annual leave entitlement: 8 days (<2 years), 12 days (2-5 years), 16 days (>5 years) as per Section 60E",
-                "Limit probation period to maximum 6 months as required by Section 11",
-                "Add rest day provisions (1 day per week) and gazetted public holiday entitlements as per Sections 60C, 60D",
-                "Include EPF contribution clause: 11% employee contribution, 12-13% employer contribution as per EPF Act 1991",
-                "Add SOCSO contribution clause for employment injury and invalidity coverage as per SOCSO Act 1969",
-                "Ensure monthly salary meets minimum wage of RM1,500 as per Minimum Wages Order 2022"
-            ],
-            "PDPA_MY": [
-                "Implement clear consent procedures with opt-in mechanisms before collecting personal data",
-                "Add comprehensive data subject rights clauses covering access, correction, and withdrawal of consent",
-                "Include purpose limitation clause specifying exact purposes for data collection and processing",
-                "Implement robust data security measures including encryption and access controls"
-            ],
-            "PDPA_SG": [
-                "Include notification requirements before collecting personal data with clear purpose statements",
-                "Designate data protection officer and include contact details",
-                "Implement consent withdrawal mechanisms and data portability procedures"
-            ],
-            "GDPR_EU": [
-                "Establish clear lawful basis for each type of data processing under Article 6",
-                "Implement comprehensive data subject rights response procedures for Articles 15-22",
-                "Conduct data protection impact assessments for high-risk processing",
-                "Implement appropriate safeguards for international data transfers"
-            ],
-            "CCPA_US": [
-                "Implement all required CCPA consumer rights: Right to Know, Delete, Correct, Limit Use of Sensitive PI, and Non-Discrimination",
-                "Provide at least 2 contact methods including toll-free number as required by CCPA § 1798.130(a)(1)",
-                "Ensure initial response within 45 days and total fulfillment within 90 days per CCPA § 1798.130(a)(2)",
-                "Remove all fees for consumer rights requests - CCPA prohibits charging consumers",
-                "Restrict service providers to specific business purposes only - prohibit use for their own purposes",
-                "Include comprehensive Notice at Collection with all CCPA-required PI categories and disclosures",
-                "Implement proper opt-out mechanisms for data selling under CCPA § 1798.115",
-                "Remove discriminatory practices - cannot charge fees or limit services for exercising rights",
-                "Add consumer privacy notice with clear disclosure of data practices under Section 1798.100",
-                "Implement opt-out mechanisms for data selling and sharing under Section 1798.120",
-                "Establish procedures for consumer rights requests under CCPA"
-            ]
-        }
-        
-        return recommendations_map.get(law, ["Consult legal counsel for jurisdiction-specific compliance"])
+        return list(_SPECIFIC_RECOMMENDATIONS.get(law, _DEFAULT_RECOMMENDATIONS))
     
     def _is_substantive_clause(self, clause_text: str) -> bool:
         """
@@ -1576,26 +1770,15 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         if not clause_text or len(clause_text.strip()) < 20:
             return False
         
-        clause_lower = clause_text.lower()
-        
-        # Reject formatting artifacts
-        formatting_indicators = [
-            "###", "##", "#", "**", "*", "```", "---", "===",
-            "summary", "analysis", "review", "note", "generated",
-            "created by", "document", "title", "header", "footer"
-        ]
-        
-        if any(indicator in clause_lower for indicator in formatting_indicators):
+        # '#' and '*' are formatting indicators on their own (and part of '##', '**', ...), so a
+        # plain character search rejects most markdown artifacts before lowercasing the clause
+        if '#' in clause_text or '*' in clause_text:
             return False
         
-        # Require substantive legal language
-        legal_indicators = [
-            "shall", "will", "agree", "party", "parties", "contract",
-            "obligation", "right", "term", "condition", "provision",
-            "whereas", "therefore", "hereby", "subject to"
-        ]
+        clause_lower = clause_text.lower()
         
-        return any(indicator in clause_lower for indicator in legal_indicators)
+        # Reject formatting artifacts and require substantive legal language
+        return _has_legal_language_without_formatting(clause_lower)
     
     def _perform_comprehensive_contract_analysis(self, contract_text: str, metadata: Dict[str, Any], 
                                                jurisdiction: str) -> Dict[str, Any]:
@@ -1604,31 +1787,13 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         Enhanced for rigorous employment contract analysis with specific statutory violations.
         """
         flagged_clauses = []
-        text_lower = contract_text.lower()
+        # The clause patterns search this lowercased copy; match offsets map back onto contract_text
+        text_lower = _lowercase_aligned(contract_text, metadata.get('text_lower') or contract_text.lower())
+        found_phrases = metadata.get('found_phrases')
         
-        # ENHANCED EMPLOYMENT CONTRACT ANALYSIS (MY jurisdiction specific)
-        if metadata['type'] == 'Employment' and jurisdiction == 'MY':
-            
-            # 1. Comprehensive Termination Analysis (Employment Act 1955, Section 12)
-            self._analyze_termination_provisions(contract_text, text_lower, flagged_clauses)
-            
-            # 2. Working Hours and Overtime Analysis (Employment Act 1955, Section 60A)
-            self._analyze_working_hours_and_overtime(contract_text, text_lower, flagged_clauses)
-            
-            # 3. Annual Leave Analysis (Employment Act 1955, Section 60E)
-            self._analyze_annual_leave_provisions(contract_text, text_lower, flagged_clauses)
-            
-            # 4. Salary and Benefits Analysis (Employment Act 1955, Various Sections)
-            self._analyze_salary_and_benefits(contract_text, text_lower, flagged_clauses)
-            
-            # 5. Probation Period Analysis (Employment Act 1955, Section 11)
-            self._analyze_probation_period(contract_text, text_lower, flagged_clauses)
-            
-            # 6. Rest Day and Public Holiday Analysis (Employment Act 1955, Sections 60C, 60D)
-            self._analyze_rest_days_and_holidays(contract_text, text_lower, flagged_clauses)
-            
-            # 7. EPF and SOCSO Compliance Analysis
-            self._analyze_statutory_contributions(contract_text, text_lower, flagged_clauses)
+        # Contract-type and jurisdiction specific analysis (e.g. Employment Act 1955 for MY employment)
+        for analyzer in _CLAUSE_ANALYZERS.get((metadata['type'], jurisdiction), ()):
+            getattr(self, analyzer)(contract_text, text_lower, flagged_clauses, found_phrases)
         
         # Data protection analysis (only if contract actually processes personal data)
         if metadata['has_data_processing']:
@@ -1639,10 +1804,10 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
                 self._analyze_ccpa_clause_violations(contract_text, text_lower, flagged_clauses)
             
             # 1. Consent mechanisms
-            if not re.search(r'consent.*(?:explicit|written|informed)', text_lower):
-                data_clause = re.search(r'(?:personal.*data|information.*collect).*?(?:\.|$)', contract_text, re.IGNORECASE | re.DOTALL)
+            if not _CONSENT_RE.search(text_lower):
+                data_clause = _DATA_CLAUSE_RE.search(text_lower)
                 if data_clause:
-                    context = data_clause.group(0)[:200] + ("..." if len(data_clause.group(0)) > 200 else "")
+                    context = _match_excerpt(data_clause, contract_text)
                     flagged_clauses.append({
                         "clause_text": context,
                         "issue": f"Missing explicit consent mechanisms required under {law_name} for personal data processing",
@@ -1661,26 +1826,21 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
                 })
         
         # General contract law issues
-        self._analyze_general_contract_issues(contract_text, text_lower, flagged_clauses)
+        self._analyze_general_contract_issues(contract_text, text_lower, flagged_clauses, found_phrases)
         
         return {"flagged_clauses": flagged_clauses}
     
-    def _analyze_termination_provisions(self, contract_text: str, text_lower: str, flagged_clauses: list):
+    def _analyze_termination_provisions(self, contract_text: str, text_lower: str, flagged_clauses: list,
+                                        found_phrases: Optional[Set[str]] = None):
         """Detailed analysis of termination provisions under Employment Act 1955 Section 12"""
         
         # Check for immediate termination without notice (except for misconduct)
-        termination_patterns = [
-            r'terminate.*without.*notice',
-            r'dismiss.*immediately',
-            r'termination.*effective.*immediately',
-            r'end.*employment.*without.*notice'
-        ]
-        
-        for pattern in termination_patterns:
-            matches = re.finditer(pattern, contract_text, re.IGNORECASE)
+        for pattern in _IMMEDIATE_TERMINATION_RES:
+            matches = pattern.finditer(text_lower, found_phrases)
             for match in matches:
                 context = self._extract_clause_context(contract_text, match.start(), match.end())
-                if 'misconduct' not in context.lower() and 'gross negligence' not in context.lower():
+                context_lower = context.lower()
+                if 'misconduct' not in context_lower and 'gross negligence' not in context_lower:
                     flagged_clauses.append({
                         "clause_text": context,
                         "issue": "Immediate termination without notice violates Employment Act 1955 Section 12 minimum notice requirements (4 weeks for employees with >2 years service, 2 weeks for <2 years)",
@@ -1689,16 +1849,11 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
                     break  # Only flag once per contract
         
         # Check for insufficient notice periods
-        notice_patterns = [
-            r'(?:notice|termination).*(?:\d+.*(?:week|month|day))',
-            r'(\d+).*?(day|week|month).*?(?:notice|termination)'
-        ]
-        
-        for pattern in notice_patterns:
-            matches = re.finditer(pattern, contract_text, re.IGNORECASE)
+        for pattern in _TERMINATION_NOTICE_RES:
+            matches = pattern.finditer(text_lower, found_phrases)
             for match in matches:
                 notice_num = int(match.group(1))
-                notice_period = match.group(2).lower()
+                notice_period = match.group(2)  # Matched in text_lower, so already lowercase
                 
                 # Convert to days for comparison
                 notice_days = notice_num
@@ -1717,21 +1872,16 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
                     })
                     break
     
-    def _analyze_working_hours_and_overtime(self, contract_text: str, text_lower: str, flagged_clauses: list):
+    def _analyze_working_hours_and_overtime(self, contract_text: str, text_lower: str, flagged_clauses: list,
+                                            found_phrases: Optional[Set[str]] = None):
         """Detailed analysis of working hours and overtime under Employment Act 1955 Section 60A"""
         
         # Check for excessive working hours
-        hours_patterns = [
-            r'(\d+).*hours?.*(?:per|each).*(?:day|daily)',
-            r'(\d+).*hours?.*(?:per|each).*(?:week|weekly)',
-            r'working.*hours?.*(\d+).*(?:per|each).*(?:day|week)'
-        ]
-        
-        for pattern in hours_patterns:
-            matches = re.finditer(pattern, contract_text, re.IGNORECASE)
+        for pattern in _WORKING_HOURS_RES:
+            matches = pattern.finditer(text_lower, found_phrases)
             for match in matches:
                 hours = int(match.group(1))
-                period_text = match.group(0).lower()
+                period_text = match.group(0)  # Matched in text_lower, so already lowercase
                 
                 context = self._extract_clause_context(contract_text, match.start(), match.end())
                 
@@ -1749,21 +1899,22 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
                     })
         
         # Check for missing overtime compensation
-        if not re.search(r'overtime.*(?:compensation|payment|rate|1\.5|time.*half)', text_lower):
+        if not (_EA_OVERTIME_RE.search(text_lower, found_phrases)):
             # Look for salary/wage sections to attach this issue to
-            wage_section = re.search(r'(?:salary|wage|compensation|remuneration).*?(?:\.|;|$)', contract_text, re.IGNORECASE | re.DOTALL)
+            wage_section = _WAGE_CLAUSE_RE.search(text_lower)
             if wage_section:
-                context = wage_section.group(0)[:200] + ("..." if len(wage_section.group(0)) > 200 else "")
+                context = _match_excerpt(wage_section, contract_text)
                 flagged_clauses.append({
                     "clause_text": context,
                     "issue": "Missing overtime compensation provisions violates Employment Act 1955 Section 60A (minimum 1.5x normal hourly rate required)",
                     "severity": "high"
                 })
     
-    def _analyze_annual_leave_provisions(self, contract_text: str, text_lower: str, flagged_clauses: list):
+    def _analyze_annual_leave_provisions(self, contract_text: str, text_lower: str, flagged_clauses: list,
+                                         found_phrases: Optional[Set[str]] = None):
         """Detailed analysis of annual leave under Employment Act 1955 Section 60E"""
         
-        if not re.search(r'annual.*leave|vacation.*day|paid.*leave', text_lower):
+        if not _LEAVE_MENTION_RE.search(text_lower):
             flagged_clauses.append({
                 "clause_text": "Employment terms and benefits",
                 "issue": "Missing annual leave entitlement violates Employment Act 1955 Section 60E (minimum 8 days for <2 years service, 12 days for 2-5 years, 16 days for >5 years)",
@@ -1771,14 +1922,8 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
             })
         else:
             # Check if annual leave is insufficient
-            leave_patterns = [
-                r'annual.*leave.*(\d+).*day',
-                r'vacation.*(\d+).*day',
-                r'(\d+).*day.*annual.*leave'
-            ]
-            
-            for pattern in leave_patterns:
-                matches = re.finditer(pattern, contract_text, re.IGNORECASE)
+            for pattern in _ANNUAL_LEAVE_DAYS_RES:
+                matches = pattern.finditer(text_lower, found_phrases)
                 for match in matches:
                     leave_days = int(match.group(1))
                     if leave_days < 8:
@@ -1790,18 +1935,13 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
                         })
                         break
     
-    def _analyze_salary_and_benefits(self, contract_text: str, text_lower: str, flagged_clauses: list):
+    def _analyze_salary_and_benefits(self, contract_text: str, text_lower: str, flagged_clauses: list,
+                                     found_phrases: Optional[Set[str]] = None):
         """Analysis of salary and benefits compliance"""
         
         # Check for below minimum wage (RM1,500 as of 2022)
-        salary_patterns = [
-            r'salary.*rm\s*(\d+(?:,\d+)*)',
-            r'wage.*rm\s*(\d+(?:,\d+)*)',
-            r'rm\s*(\d+(?:,\d+)*).*(?:salary|wage|month)'
-        ]
-        
-        for pattern in salary_patterns:
-            matches = re.finditer(pattern, contract_text, re.IGNORECASE)
+        for pattern in _MONTHLY_SALARY_RES:
+            matches = pattern.finditer(text_lower, found_phrases)
             for match in matches:
                 salary_str = match.group(1).replace(',', '')
                 salary_amount = int(salary_str)
@@ -1815,17 +1955,12 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
                     })
                     break
     
-    def _analyze_probation_period(self, contract_text: str, text_lower: str, flagged_clauses: list):
+    def _analyze_probation_period(self, contract_text: str, text_lower: str, flagged_clauses: list,
+                                  found_phrases: Optional[Set[str]] = None):
         """Analysis of probation period under Employment Act 1955 Section 11"""
         
-        probation_patterns = [
-            r'probation.*period.*(\d+).*month',
-            r'probationary.*(\d+).*month',
-            r'(\d+).*month.*probation'
-        ]
-        
-        for pattern in probation_patterns:
-            matches = re.finditer(pattern, contract_text, re.IGNORECASE)
+        for pattern in _PROBATION_MONTHS_RES:
+            matches = pattern.finditer(text_lower, found_phrases)
             for match in matches:
                 probation_months = int(match.group(1))
                 if probation_months > 6:
@@ -1837,38 +1972,41 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
                     })
                     break
     
-    def _analyze_rest_days_and_holidays(self, contract_text: str, text_lower: str, flagged_clauses: list):
+    def _analyze_rest_days_and_holidays(self, contract_text: str, text_lower: str, flagged_clauses: list,
+                                        found_phrases: Optional[Set[str]] = None):
         """Analysis of rest days and public holidays under Employment Act 1955 Sections 60C, 60D"""
         
-        if not re.search(r'rest.*day|public.*holiday|gazetted.*holiday', text_lower):
+        if not (_EA_REST_DAY_RE.search(text_lower, found_phrases)):
             flagged_clauses.append({
                 "clause_text": "Employment terms and working conditions",
                 "issue": "Missing rest day and public holiday provisions required under Employment Act 1955 Sections 60C and 60D",
                 "severity": "medium"
             })
     
-    def _analyze_statutory_contributions(self, contract_text: str, text_lower: str, flagged_clauses: list):
+    def _analyze_statutory_contributions(self, contract_text: str, text_lower: str, flagged_clauses: list,
+                                         found_phrases: Optional[Set[str]] = None):
         """Analysis of EPF and SOCSO contributions"""
         
-        if not re.search(r'epf|employees.*provident.*fund', text_lower):
+        if not (_EA_EPF_RE.search(text_lower, found_phrases)):
             flagged_clauses.append({
                 "clause_text": "Employee benefits and contributions",
                 "issue": "Missing EPF (Employees Provident Fund) contribution provisions as required under EPF Act 1991",
                 "severity": "medium"
             })
         
-        if not re.search(r'socso|social.*security|employment.*injury', text_lower):
+        if not (_EA_SOCSO_RE.search(text_lower, found_phrases)):
             flagged_clauses.append({
                 "clause_text": "Employee benefits and contributions",
                 "issue": "Missing SOCSO (Social Security Organisation) contribution provisions as required under SOCSO Act 1969",
                 "severity": "medium"
             })
     
-    def _analyze_general_contract_issues(self, contract_text: str, text_lower: str, flagged_clauses: list):
+    def _analyze_general_contract_issues(self, contract_text: str, text_lower: str, flagged_clauses: list,
+                                         found_phrases: Optional[Set[str]] = None):
         """Analysis of general contract law issues"""
         
         # 1. Unconscionable liability limitations
-        liability_match = re.search(r'liability.*limited.*to.*(?:rm\s*)?(\d+(?:,\d+)*)', text_lower)
+        liability_match = _LIABILITY_CAP_RE.search(text_lower, found_phrases)
         if liability_match:
             amount_str = liability_match.group(1).replace(',', '')
             amount = int(amount_str)
@@ -1881,10 +2019,10 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
                 })
         
         # 2. Unilateral modification rights
-        if re.search(r'(?:company|employer|party).*may.*(?:modify|change|alter).*(?:unilaterally|without.*consent)', text_lower):
-            modification_clause = re.search(r'(?:company|employer|party).*may.*(?:modify|change|alter).*?(?:\.|$)', contract_text, re.IGNORECASE | re.DOTALL)
+        if _UNILATERAL_MODIFICATION_RE.search(text_lower, found_phrases):
+            modification_clause = _MODIFICATION_CLAUSE_RE.search(text_lower)
             if modification_clause:
-                context = modification_clause.group(0)[:200] + ("..." if len(modification_clause.group(0)) > 200 else "")
+                context = _match_excerpt(modification_clause, contract_text)
                 flagged_clauses.append({
                     "clause_text": context,
                     "issue": "Unilateral modification rights without consideration may be unenforceable under contract law",
@@ -1892,7 +2030,7 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
                 })
         
         # 3. Missing essential contract elements
-        if not re.search(r'consideration|payment|compensation|remuneration', text_lower):
+        if not _CONSIDERATION_RE.search(text_lower):
             flagged_clauses.append({
                 "clause_text": "Contract terms and conditions",
                 "issue": "Missing consideration or payment terms may affect contract enforceability under contract law",
@@ -1910,8 +2048,8 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         # Try to find sentence boundaries
         context = contract_text[start_context:end_context]
         
-        # Clean up the context
-        context = re.sub(r'\s+', ' ', context).strip()
+        # Clean up the context: collapse whitespace runs and trim the ends
+        context = ' '.join(context.split())
         
         if len(context) > 200:
             context = context[:200] + "..."
@@ -1932,15 +2070,15 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         missing_rights = []
         
         # Right to Correct (§ 1798.106)
-        if not re.search(r'right\s+to\s+correct|correct.*personal.*information|rectif', text_lower):
+        if not _CCPA_RIGHT_TO_CORRECT_RE.search(text_lower):
             missing_rights.append("Right to Correct personal information")
         
         # Right to Limit Use of Sensitive Personal Information (§ 1798.121)
-        if not re.search(r'limit.*use.*sensitive|sensitive.*personal.*information.*limit|opt.*out.*sensitive', text_lower):
+        if not _CCPA_LIMIT_SENSITIVE_RE.search(text_lower):
             missing_rights.append("Right to Limit Use of Sensitive Personal Information")
         
         # Right of Non-Discrimination (§ 1798.125)
-        if not re.search(r'non.*discrimination|right.*not.*discriminate|equal.*treatment', text_lower):
+        if not _CCPA_NON_DISCRIMINATION_RE.search(text_lower):
             missing_rights.append("Right of Non-Discrimination")
         
         if missing_rights:
@@ -1951,11 +2089,11 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         discrimination_violations = []
         
         # Check for prohibited fee structures when opting out
-        if re.search(r'opt.*out.*(?:may|will|result).*(?:additional|extra).*fee|fee.*opt.*out|charge.*opt.*out', text_lower):
+        if _CCPA_OPT_OUT_FEE_RE.search(text_lower):
             discrimination_violations.append("Charging fees for opt-out requests (§ 1798.125(a)(1))")
         
         # Check for service limitations tied to opt-out
-        if re.search(r'opt.*out.*(?:may|will).*limit.*service|service.*limited.*opt.*out', text_lower):
+        if _CCPA_OPT_OUT_SERVICE_LIMIT_RE.search(text_lower):
             discrimination_violations.append("Limiting services for opt-out requests (§ 1798.125(a)(2))")
         
         if discrimination_violations:
@@ -1966,19 +2104,19 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         contact_methods = []
         
         # Check for toll-free number
-        if re.search(r'toll.*free|1.*800.*|1.*888.*|1.*877.*|1.*866.*', text_lower):
+        if _CCPA_TOLL_FREE_RE.search(text_lower):
             contact_methods.append("toll-free")
         
         # Check for website
-        if re.search(r'website|online.*form|web.*form|www\.|http', text_lower):
+        if _CCPA_WEBSITE_RE.search(text_lower):
             contact_methods.append("website")
         
         # Check for email
-        if re.search(r'email|@.*\.com|contact.*email', text_lower):
+        if _CCPA_EMAIL_RE.search(text_lower):
             contact_methods.append("email")
         
         # Check for postal address
-        if re.search(r'mail.*address|postal.*address|mailing.*address|street.*address', text_lower):
+        if _CCPA_POSTAL_RE.search(text_lower):
             contact_methods.append("postal")
         
         if len(contact_methods) < 2:
@@ -1991,14 +2129,14 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         response_time_violations = []
         
         # Check for response times over 45 days initial response
-        response_matches = re.finditer(r'respond.*within.*(\d+).*days?|(\d+).*days?.*respond', text_lower)
+        response_matches = _CCPA_RESPONSE_DAYS_RE.finditer(text_lower)
         for match in response_matches:
             days = int(match.group(1) or match.group(2))
             if days > 45:
                 response_time_violations.append(f"Initial response time of {days} days exceeds CCPA § 1798.130(a)(2) maximum of 45 days")
         
         # Check for total fulfillment time over 90 days
-        fulfillment_matches = re.finditer(r'fulfill.*within.*(\d+).*days?|complete.*within.*(\d+).*days?', text_lower)
+        fulfillment_matches = _CCPA_FULFILLMENT_DAYS_RE.finditer(text_lower)
         for match in fulfillment_matches:
             days = int(match.group(1) or match.group(2))
             if days > 90:
@@ -2012,15 +2150,15 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         fee_violations = []
         
         # Check for verification fees
-        if re.search(r'verification.*fee|fee.*verification|charge.*verify|verification.*cost', text_lower):
+        if _CCPA_VERIFICATION_FEE_RE.search(text_lower):
             fee_violations.append("Charging verification fees")
         
         # Check for processing fees
-        if re.search(r'processing.*fee|fee.*processing|charge.*process.*request', text_lower):
+        if _CCPA_PROCESSING_FEE_RE.search(text_lower):
             fee_violations.append("Charging processing fees")
         
         # Check for any consumer request fees
-        if re.search(r'fee.*consumer.*request|charge.*consumer.*right|cost.*exercise.*right', text_lower):
+        if _CCPA_RIGHTS_FEE_RE.search(text_lower):
             fee_violations.append("Charging fees for exercising consumer rights")
         
         if fee_violations:
@@ -2031,15 +2169,15 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         service_provider_violations = []
         
         # Check if service providers can use data for own purposes
-        if re.search(r'service.*provider.*(?:can|may|use).*(?:own|their).*purpose|vendor.*use.*own.*business', text_lower):
+        if _CCPA_PROVIDER_OWN_PURPOSE_RE.search(text_lower):
             service_provider_violations.append("Allowing service providers to use data for their own business purposes")
         
         # Check if service providers can sell/share data
-        if re.search(r'service.*provider.*(?:sell|share).*data|vendor.*sell.*data|third.*party.*sell', text_lower):
+        if _CCPA_PROVIDER_SALE_RE.search(text_lower):
             service_provider_violations.append("Allowing service providers to sell or share personal information")
         
         # Check for lack of service provider restrictions
-        if re.search(r'service.*provider|vendor|third.*party', text_lower) and not re.search(r'service.*provider.*(?:shall|must|limited|restrict)', text_lower):
+        if _CCPA_PROVIDER_RE.search(text_lower) and not _CCPA_PROVIDER_RESTRICTION_RE.search(text_lower):
             service_provider_violations.append("Missing service provider restrictions and oversight requirements")
         
         if service_provider_violations:
@@ -2050,26 +2188,21 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         notice_violations = []
         
         # Check for specific CCPA PI categories
-        ccpa_categories = [
-            'identifiers', 'commercial information', 'biometric information', 
-            'internet activity', 'geolocation data', 'sensory data', 
-            'professional information', 'education information', 'inferences'
-        ]
-        categories_mentioned = sum(1 for cat in ccpa_categories if cat.replace(' ', '.*') in text_lower)
+        categories_mentioned = sum(1 for cat in _CCPA_PI_CATEGORY_TERMS if cat in text_lower)
         
         if categories_mentioned < 3:
             notice_violations.append(f"Missing CCPA-specific personal information categories (only {categories_mentioned}/9 mentioned)")
         
         # Check for retention periods
-        if not re.search(r'retention.*period|retain.*for|keep.*for.*year|delete.*after', text_lower):
+        if not _CCPA_RETENTION_RE.search(text_lower):
             notice_violations.append("Missing retention period disclosure")
         
         # Check for source disclosure
-        if not re.search(r'source.*information|collect.*from|obtain.*from|gather.*from', text_lower):
+        if not _CCPA_SOURCE_RE.search(text_lower):
             notice_violations.append("Missing source of information disclosure")
         
         # Check for third party categories
-        if not re.search(r'third.*part.*categor|share.*with.*type|disclose.*to.*categor', text_lower):
+        if not _CCPA_THIRD_PARTY_CATEGORIES_RE.search(text_lower):
             notice_violations.append("Missing third party categories disclosure")
         
         if notice_violations:
@@ -2080,14 +2213,13 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         additional_violations = []
         
         # Check for proper data sale disclosure (§ 1798.115)
-        if re.search(r'sell.*data|sale.*personal.*information|sell.*personal', text_lower):
-            if not re.search(r'opt.*out|do.*not.*sell', text_lower):
+        if _CCPA_DATA_SALE_RE.search(text_lower):
+            if not _CCPA_OPT_OUT_RE.search(text_lower):
                 additional_violations.append("Data sale disclosed but missing required opt-out notice under § 1798.115")
         
         # Check for sensitive PI handling (§ 1798.121)
-        sensitive_terms = ['health', 'biometric', 'genetic', 'precise geolocation', 'racial', 'religious', 'sexual orientation']
-        if any(term in text_lower for term in sensitive_terms):
-            if not re.search(r'sensitive.*personal.*information|limit.*use.*sensitive', text_lower):
+        if any(term in text_lower for term in _CCPA_SENSITIVE_TERMS):
+            if not _CCPA_SENSITIVE_DISCLOSURE_RE.search(text_lower):
                 additional_violations.append("Handling sensitive personal information without proper CCPA § 1798.121 disclosures")
         
         if additional_violations:
@@ -2103,15 +2235,8 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         Extract exact clause text that contains violations.
         """
         # 1. CRITICAL: Detect discrimination clauses (§ 1798.125)
-        discrimination_patterns = [
-            r'opt.*out.*(?:may|will|result).*(?:additional|extra).*fee[^.]*\.',
-            r'opt.*out.*(?:may|will).*limit.*service[^.]*\.',
-            r'(?:additional|extra).*fee.*opt.*out[^.]*\.',
-            r'service.*limited.*opt.*out[^.]*\.'
-        ]
-        
-        for pattern in discrimination_patterns:
-            matches = re.finditer(pattern, contract_text, re.IGNORECASE | re.DOTALL)
+        for pattern in _CCPA_DISCRIMINATION_CLAUSE_RES:
+            matches = pattern.finditer(contract_text)
             for match in matches:
                 clause_text = match.group(0).strip()
                 if len(clause_text) > 20:  # Ensure substantial content
@@ -2122,15 +2247,8 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
                     })
         
         # 2. HIGH PRIORITY: Service provider violations (§ 1798.140(ag))
-        service_provider_patterns = [
-            r'service.*provider.*(?:can|may|use).*(?:own|their).*purpose[^.]*\.',
-            r'vendor.*use.*own.*business[^.]*\.',
-            r'service.*provider.*(?:sell|share).*data[^.]*\.',
-            r'third.*party.*sell.*data[^.]*\.'
-        ]
-        
-        for pattern in service_provider_patterns:
-            matches = re.finditer(pattern, contract_text, re.IGNORECASE | re.DOTALL)
+        for pattern in _CCPA_SERVICE_PROVIDER_CLAUSE_RES:
+            matches = pattern.finditer(contract_text)
             for match in matches:
                 clause_text = match.group(0).strip()
                 if len(clause_text) > 20:
@@ -2141,16 +2259,8 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
                     })
         
         # 3. HIGH PRIORITY: Prohibited fee structures (§ 1798.130(a)(2))
-        fee_patterns = [
-            r'verification.*fee[^.]*\.',
-            r'fee.*verification[^.]*\.',
-            r'processing.*fee.*request[^.]*\.',
-            r'charge.*verify[^.]*\.',
-            r'cost.*exercise.*right[^.]*\.'
-        ]
-        
-        for pattern in fee_patterns:
-            matches = re.finditer(pattern, contract_text, re.IGNORECASE | re.DOTALL)
+        for pattern in _CCPA_FEE_CLAUSE_RES:
+            matches = pattern.finditer(contract_text)
             for match in matches:
                 clause_text = match.group(0).strip()
                 if len(clause_text) > 20:
@@ -2161,16 +2271,11 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
                     })
         
         # 4. MEDIUM PRIORITY: Response time violations (§ 1798.130(a)(2))
-        response_time_patterns = [
-            r'respond.*within.*(\d+).*days?[^.]*\.',
-            r'(\d+).*days?.*respond.*request[^.]*\.'
-        ]
-        
-        for pattern in response_time_patterns:
-            matches = re.finditer(pattern, contract_text, re.IGNORECASE | re.DOTALL)
+        for pattern in _CCPA_RESPONSE_TIME_CLAUSE_RES:
+            matches = pattern.finditer(contract_text)
             for match in matches:
                 clause_text = match.group(0).strip()
-                days_match = re.search(r'(\d+)', clause_text)
+                days_match = _FIRST_NUMBER_RE.search(clause_text)
                 if days_match and int(days_match.group(1)) > 45:
                     flagged_clauses.append({
                         "clause_text": clause_text,
@@ -2180,20 +2285,19 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         
         # 5. MEDIUM PRIORITY: Contact method violations (§ 1798.130)
         # Check entire contact section for inadequate methods
-        contact_section_pattern = r'(?:how.*to.*exercise|contact.*us|exercise.*rights)[\s\S]*?(?=\n\s*#{1,6}|\n\s*\*\*|$)'
-        contact_match = re.search(contact_section_pattern, contract_text, re.IGNORECASE)
+        contact_match = _CCPA_CONTACT_SECTION_RE.search(contract_text)
         
         if contact_match:
             contact_section = contact_match.group(0)
             contact_methods = 0
             
-            if re.search(r'toll.*free|1.*800.*|1.*888.*|1.*877.*|1.*866.*', contact_section, re.IGNORECASE):
+            if _CCPA_CONTACT_TOLL_FREE_RE.search(contact_section):
                 contact_methods += 1
-            if re.search(r'website|online.*form|web.*form|www\.|http', contact_section, re.IGNORECASE):
+            if _CCPA_CONTACT_WEBSITE_RE.search(contact_section):
                 contact_methods += 1
-            if re.search(r'email|@.*\.com', contact_section, re.IGNORECASE):
+            if _CCPA_CONTACT_EMAIL_RE.search(contact_section):
                 contact_methods += 1
-            if re.search(r'mail.*address|postal.*address|mailing.*address|street.*address', contact_section, re.IGNORECASE):
+            if _CCPA_CONTACT_POSTAL_RE.search(contact_section):
                 contact_methods += 1
             
             if contact_methods < 2:
@@ -2206,11 +2310,10 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
                 })
         
         # 6. CRITICAL: Data sale without proper opt-out (§ 1798.115)
-        data_sale_pattern = r'(?:sell.*personal.*information|sale.*personal.*data)(?:(?!opt.*out|do.*not.*sell).)*[^.]*\.'
-        matches = re.finditer(data_sale_pattern, contract_text, re.IGNORECASE | re.DOTALL)
+        matches = _CCPA_DATA_SALE_CLAUSE_RE.finditer(contract_text)
         for match in matches:
             clause_text = match.group(0).strip()
-            if len(clause_text) > 20 and not re.search(r'opt.*out|do.*not.*sell', clause_text, re.IGNORECASE):
+            if len(clause_text) > 20 and not _CCPA_CLAUSE_OPT_OUT_RE.search(clause_text):
                 flagged_clauses.append({
                     "clause_text": clause_text,
                     "issue": "DATA SALE VIOLATION: Personal information sale disclosed without required opt-out notice under CCPA § 1798.115",
@@ -2225,53 +2328,53 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         """
         validated_issues = []
         
-        jurisdiction_laws = {
-            "MY": ["EMPLOYMENT_ACT_MY", "PDPA_MY"],
-            "SG": ["PDPA_SG"],
-            "EU": ["GDPR_EU"],
-            "US": ["CCPA_US"]
-        }
-        
-        applicable_laws = jurisdiction_laws.get(jurisdiction, [])
+        applicable_laws = _JURISDICTION_LAWS.get(jurisdiction, ())
         
         for issue in compliance_issues:
             law = issue.get('law', '')
             
             # Ensure law is applicable to jurisdiction
             if law not in applicable_laws:
-                logger.warning(f"Filtering out inapplicable law '{law}' for jurisdiction '{jurisdiction}'")
+                logger.warning("Filtering out inapplicable law '%s' for jurisdiction '%s'", law, jurisdiction)
                 continue
             
             # Ensure issue has required fields
             if not issue.get('missing_requirements'):
-                logger.warning(f"Filtering out compliance issue with no missing requirements: {law}")
+                logger.warning("Filtering out compliance issue with no missing requirements: %s", law)
                 continue
             
             if not issue.get('recommendations'):
-                logger.warning(f"Filtering out compliance issue with no recommendations: {law}")
+                logger.warning("Filtering out compliance issue with no recommendations: %s", law)
                 continue
             
             # Filter out empty or placeholder requirements
-            valid_requirements = [
-                req for req in issue.get('missing_requirements', [])
-                if req and len(req.strip()) > 10 and not self._is_generic_placeholder(req)
-            ]
-            
-            valid_recommendations = [
-                rec for rec in issue.get('recommendations', [])
-                if rec and len(rec.strip()) > 10 and not self._is_generic_placeholder(rec)
-            ]
+            valid_requirements = self._filter_issue_texts(issue.get('missing_requirements', []))
+            valid_recommendations = self._filter_issue_texts(issue.get('recommendations', []))
             
             if valid_requirements and valid_recommendations:
                 issue['missing_requirements'] = valid_requirements
                 issue['recommendations'] = valid_recommendations
                 validated_issues.append(issue)
             else:
-                logger.warning(f"Filtering out compliance issue with insufficient detail: {law}")
+                logger.warning("Filtering out compliance issue with insufficient detail: %s", law)
         
         logger.info(f"Validated {len(validated_issues)}/{len(compliance_issues)} compliance issues")
         return validated_issues
     
+    def _filter_issue_texts(self, texts: List[str]) -> List[str]:
+        """
+        Drop empty, too short and placeholder entries from a requirement or recommendation list.
+        The list itself is returned when every entry is valid, which is the usual case.
+        """
+        for index, text in enumerate(texts):
+            if not self._is_valid_issue_text(text):
+                return list(texts[:index]) + [rest for rest in texts[index + 1:] if self._is_valid_issue_text(rest)]
+        return texts
+    
+    def _is_valid_issue_text(self, text: str) -> bool:
+        """True for a requirement or recommendation with real content."""
+        return bool(text) and len(text.strip()) > 10 and not self._is_generic_placeholder(text)
+    
     def _apply_critical_legal_analysis(self, flagged_clauses: List[Dict[str, Any]], 
                                      metadata: Dict[str, Any], jurisdiction: str) -> List[Dict[str, Any]]:
         """
@@ -2297,41 +2400,26 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
                 priority_score += 1
             
             # Legal significance indicators
-            critical_indicators = [
-                'violation', 'violates', 'prohibited', 'critical', 'mandatory',
-                'statutory', 'criminal', 'penalty', 'fine', 'breach', 'illegal',
-                'non-compliance', 'contravenes', 'discrimination'
-            ]
-            
             issue_lower = issue.lower()
-            for indicator in critical_indicators:
+            for indicator in _CRITICAL_ISSUE_INDICATORS:
                 if indicator in issue_lower:
                     priority_score += 3
             
             # Jurisdiction-specific critical issues
-            if jurisdiction == 'US':
-                ccpa_critical = ['discrimination', 'fee', 'service provider', 'response time']
-                for critical_term in ccpa_critical:
-                    if critical_term in issue_lower:
-                        priority_score += 5
-            elif jurisdiction == 'MY':
-                employment_critical = ['termination', 'overtime', 'working hours', 'minimum wage']
-                for critical_term in employment_critical:
-                    if critical_term in issue_lower:
-                        priority_score += 5
+            for critical_term in _JURISDICTION_CRITICAL_TERMS.get(jurisdiction, ()):
+                if critical_term in issue_lower:
+                    priority_score += 5
             
             # Only include clauses that meet minimum priority threshold
             if priority_score >= 8:  # High priority threshold
                 clause['priority_score'] = priority_score
                 critical_clauses.append(clause)
             else:
-                logger.debug(f"Filtered out low-priority clause (score: {priority_score}): {issue[:50]}...")
+                logger.debug("Filtered out low-priority clause (score: %s): %.50s...", priority_score, issue)
         
-        # Sort by priority score and limit to most critical issues
-        critical_clauses.sort(key=lambda x: x.get('priority_score', 0), reverse=True)
-        
-        # Limit to top 10 most critical issues to avoid overwhelming the user
-        critical_clauses = critical_clauses[:10]
+        # Keep the 10 highest-priority issues to avoid overwhelming the user; nlargest keeps the
+        # order a stable descending sort would give, without sorting every candidate
+        critical_clauses = heapq.nlargest(10, critical_clauses, key=lambda x: x.get('priority_score', 0))
         
         logger.info(f"Critical legal analysis: {len(critical_clauses)}/{len(flagged_clauses)} clauses passed priority filter")
         return critical_clauses
@@ -2343,22 +2431,16 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         """
         try:
             # Parse existing Granite response
-            granite_json = json.loads(granite_response)
+            granite_json = json_loads(granite_response)
         except json.JSONDecodeError:
             logger.warning("Could not parse Granite response, creating new analysis")
             granite_json = {"summary": "", "flagged_clauses": [], "compliance_issues": []}
         
         # Get our intelligent analysis to supplement Granite
-        intelligent_analysis = self._get_intelligent_mock_analysis(
+        intelligent_json = self._build_analysis_dict(
             contract_text, metadata, {}, jurisdiction
         )
         
-        try:
-            intelligent_json = json.loads(intelligent_analysis)
-        except json.JSONDecodeError:
-            logger.error("Could not parse intelligent analysis")
-            return granite_response
-        
         # Merge the analyses - prefer Granite's results but supplement with ours
         merged_flagged = list(granite_json.get("flagged_clauses", []))
         merged_compliance = list(granite_json.get("compliance_issues", []))
@@ -2375,10 +2457,12 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         
         # Add our compliance issues if Granite didn't find enough
         if len(merged_compliance) < 2:
+            # Avoid duplicates by law type
+            seen_laws = {existing.get("law", "") for existing in merged_compliance}
             for issue in intelligent_json.get("compliance_issues", []):
-                # Avoid duplicates by law type
                 law = issue.get("law", "")
-                if not any(law == existing.get("law", "") for existing in merged_compliance):
+                if law not in seen_laws:
+                    seen_laws.add(law)
                     merged_compliance.append(issue)
         
         # Create enhanced summary
@@ -2394,7 +2478,7 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         }
         
         logger.info(f"Enhanced Granite response: {len(merged_flagged)} flagged clauses, {len(merged_compliance)} compliance issues")
-        return json.dumps(enhanced_response)
+        return json_dumps(enhanced_response)
     
     def _create_enhanced_summary(self, granite_summary: str, intelligent_summary: str,
                                 flagged_count: int, compliance_count: int,
@@ -2402,9 +2486,7 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         """
         Create an enhanced summary combining Granite and intelligent analysis.
         """
-        jurisdiction_name = {
-            "MY": "Malaysia", "SG": "Singapore", "EU": "European Union", "US": "United States"
-        }.get(jurisdiction, jurisdiction)
+        jurisdiction_name = _JURISDICTION_NAMES.get(jurisdiction, jurisdiction)
         
         # Use Granite summary if substantial, otherwise use intelligent summary
         base_summary = granite_summary if len(granite_summary) > 50 else intelligent_summary
@@ -2436,24 +2518,12 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
             return True
         
         # Filter out generic or non-specific issues
-        generic_indicators = [
-            'review recommended', 'consider adding', 'may want to include',
-            'formatting issue', 'style concern', 'minor adjustment',
-            'cosmetic change', 'presentation'
-        ]
-        
         issue_lower = issue_text.lower()
-        if any(indicator in issue_lower for indicator in generic_indicators):
+        if _contains_generic_issue_wording(issue_lower):
             return False
         
         # Require legal significance indicators
-        legal_significance = [
-            'violates', 'violation', 'non-compliance', 'prohibited', 'illegal',
-            'breach', 'contravenes', 'mandatory', 'required by law', 'statutory',
-            'regulation', 'act', 'section', 'article', 'code', 'ordinance'
-        ]
-        
-        if any(indicator in issue_lower for indicator in legal_significance):
+        if _contains_legal_significance(issue_lower):
             return True
         
         # Check if clause text appears to be substantive contract content
@@ -2463,14 +2533,8 @@ OUTPUT FORMAT: Valid JSON with summary, flagged_clauses, and compliance_issues a
         # Medium severity issues need additional validation
         if severity == 'medium':
             # Must reference specific legal concepts
-            legal_concepts = [
-                'liability', 'damages', 'termination', 'breach', 'warranty',
-                'indemnification', 'jurisdiction', 'governing law', 'arbitration',
-                'intellectual property', 'confidentiality', 'non-disclosure'
-            ]
-            
             combined_text = (issue_text + ' ' + clause_text).lower()
-            return any(concept in combined_text for concept in legal_concepts)
+            return _contains_legal_concept(combined_text)
         
         # Low severity issues are generally filtered out unless very specific
         return False
\ No newline at end of file
@@ -124,7 +124,8 @@ class WatsonXClient:
         
         try:
             logger.debug(f"Making request to WatsonX API: {self.config.base_url}")
-            logger.debug(f"Request body: {body}")
+            # Lazy formatting: the body embeds the full prompt, so only render it when debug is enabled
+            logger.debug("Request body: %s", body)
             response = requests.post(
                 self.config.base_url,
                 headers=headers,
@@ -134,7 +135,7 @@ class WatsonXClient:
             
             # Log response details for debugging
             logger.debug(f"Response status: {response.status_code}")
-            logger.debug(f"Response headers: {dict(response.headers)}")
+            logger.debug("Response headers: %s", response.headers)
             
             if response.status_code != 200:
                 logger.error(f"API request failed with status {response.status_code}")
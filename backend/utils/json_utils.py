@@ -0,0 +1,25 @@
+"""JSON helpers shared by the services and routes that handle AI responses."""
+
+import json
+from typing import Any
+
+# orjson is an optional, faster drop-in for (de)serializing AI responses; its
+# JSONDecodeError subclasses json.JSONDecodeError so error handling is unchanged
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(text: str) -> Any:
+    """Parse JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -25,6 +25,7 @@ class LawLoader:
         self._contract_types: Dict[str, Any] = {}
         self._risk_levels: Dict[str, Any] = {}
         self._metadata: Dict[str, Any] = {}
+        self._checklist_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
         
         # Perform the two-stage load
         self._initialize_from_mappings()
@@ -100,7 +101,13 @@ class LawLoader:
         """
         Builds a detailed compliance checklist for the AI, using the rich data.
         This is now the primary method for feeding context to the AI.
+        Checklists are cached per (jurisdiction, contract type) and shared, so callers must not modify them.
         """
+        cache_key = (jurisdiction.upper(), contract_type)
+        cached_checklist = self._checklist_cache.get(cache_key)
+        if cached_checklist is not None:
+            return cached_checklist
+        
         applicable_laws = self.get_laws_for_jurisdiction(jurisdiction)
         checklist = {}
 
@@ -114,6 +121,8 @@ class LawLoader:
                     "key_provisions": law_data.get("key_provisions"),
                     "contract_specific_requirements": law_data.get("contract_specific_requirements")
                 }
+        
+        self._checklist_cache[cache_key] = checklist
         return checklist
 
     def get_law_details(self, law_code: str) -> Optional[Dict[str, Any]]:
@@ -0,0 +1,252 @@
+import unittest
+import sys
+import json
+import os
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# The service imports its siblings as top-level packages (models, service, utils)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+
+from backend.service import ContractAnalyzerService as analyzer_module
+from backend.service.ContractAnalyzerService import ContractAnalyzerService
+from backend.utils import json_utils
+
+SAMPLE_CONTRACTS = (
+    "EMPLOYMENT AGREEMENT\n\n"
+    "1. The Employee shall work 10 hours per day and 50 hours each week.\n"
+    "2. The monthly salary is RM 1,200, and the wage is paid on the last day of the month.\n"
+    "3. Annual leave of 5 days is granted. The probation period is 8 months.\n"
+    "4. The Company may terminate without notice. The Employer may dismiss immediately.\n"
+    "5. Either party may end the employment by giving 1 week notice.\n"
+    "6. Liability is limited to RM 500. The Company may modify these terms unilaterally.\n",
+
+    "EMPLOYMENT CONTRACT\n\n"
+    "The Employee's working hours are 8 hours per day. Overtime is paid at a rate of 1.5 times.\n"
+    "The Employee is entitled to one rest day each week and every gazetted public holiday.\n"
+    "The Employer contributes to the Employees Provident Fund (EPF) and SOCSO for employment injury.\n"
+    "Vacation of 14 days per year. Probationary period of 3 months.\n",
+
+    "SERVICE AGREEMENT\n\n"
+    "The Provider will collect personal data with the explicit consent of each customer.\n"
+    "Data subject rights to access, rectification and erasure are respected.\n"
+    "Consideration: payment of RM 20,000 within 30 days of invoice.\n",
+
+    "WORKING HOURS: 9 HOURS PER DAY. İSTANBUL OFFICE. SALARY RM900.\n",
+
+    "Hello world.",
+)
+
+
+class TestClausePatternGating(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.service = ContractAnalyzerService()
+
+    def _prepared(self, contract_text):
+        cleaned = self.service._preprocess_contract_text(contract_text)
+        metadata = self.service._analyze_contract_metadata(cleaned)
+        self.assertIn('found_phrases', metadata)
+        return cleaned, metadata
+
+    def test_01_every_clause_literal_is_scanned(self):
+        for literal in analyzer_module._CLAUSE_LITERALS:
+            self.assertIn(literal, analyzer_module._METADATA_PHRASES)
+
+    def test_02_clause_analyzers_ignore_gating(self):
+        analyzers = {name for names in analyzer_module._CLAUSE_ANALYZERS.values() for name in names}
+        analyzers.add('_analyze_general_contract_issues')
+        for contract_text in SAMPLE_CONTRACTS:
+            cleaned, metadata = self._prepared(contract_text)
+            text_lower = analyzer_module._lowercase_aligned(cleaned, metadata['text_lower'])
+            for analyzer in sorted(analyzers):
+                with self.subTest(analyzer=analyzer, contract=contract_text[:30]):
+                    ungated, gated = [], []
+                    getattr(self.service, analyzer)(cleaned, text_lower, ungated, None)
+                    getattr(self.service, analyzer)(cleaned, text_lower, gated, metadata['found_phrases'])
+                    self.assertEqual(ungated, gated)
+
+    def test_03_compliance_issues_ignore_gating(self):
+        for contract_text in SAMPLE_CONTRACTS:
+            cleaned, metadata = self._prepared(contract_text)
+            ungated_metadata = dict(metadata, found_phrases=None)
+            for contract_type in ('Employment', 'Service'):
+                for jurisdiction in ('MY', 'SG', 'EU', 'US'):
+                    with self.subTest(type=contract_type, jurisdiction=jurisdiction, contract=contract_text[:30]):
+                        gated_metadata = dict(metadata, type=contract_type)
+                        self.assertEqual(
+                            self.service._generate_smart_compliance_issues(cleaned, dict(ungated_metadata, type=contract_type), jurisdiction),
+                            self.service._generate_smart_compliance_issues(cleaned, gated_metadata, jurisdiction)
+                        )
+                        self.assertEqual(
+                            self.service._perform_comprehensive_contract_analysis(cleaned, dict(ungated_metadata, type=contract_type), jurisdiction),
+                            self.service._perform_comprehensive_contract_analysis(cleaned, gated_metadata, jurisdiction)
+                        )
+
+
+class TestEmploymentActHoursPattern(unittest.TestCase):
+    def _match(self, text):
+        match = analyzer_module._EA_HOURS_RE.search(text.lower())
+        return match and (int(match['hours']), match['unit'])
+
+    def test_01_hours_per_day(self):
+        self.assertEqual(self._match("The Employee shall work 8 hours per day."), (8, 'day'))
+
+    def test_02_hours_each_week(self):
+        self.assertEqual(self._match("Normal working time is 48 hours each week."), (48, 'week'))
+
+    def test_03_no_match_across_sentences_or_other_units(self):
+        for text in (
+            "Clause 12 covers working hours. Wages are paid each week.",
+            "Training of 10 hours is required per month.",
+        ):
+            with self.subTest(text=text):
+                self.assertIsNone(self._match(text))
+
+
+class TestWatsonxConcurrencySetting(unittest.TestCase):
+    def _parse(self, value):
+        environ = {} if value is None else {'WATSONX_MAX_CONCURRENCY': value}
+        with mock.patch.dict(os.environ, environ, clear=True):
+            return analyzer_module._positive_int_from_env('WATSONX_MAX_CONCURRENCY', 4)
+
+    def test_01_valid_value(self):
+        self.assertEqual(self._parse('8'), 8)
+
+    def test_02_unset_uses_default(self):
+        self.assertEqual(self._parse(None), 4)
+
+    def test_03_invalid_values_use_default(self):
+        for value in ('', 'four', '2.5', '0', '-3'):
+            with self.subTest(value=value):
+                self.assertEqual(self._parse(value), 4)
+
+
+class TestPreparedContractCache(unittest.TestCase):
+    def setUp(self):
+        self.service = ContractAnalyzerService()
+        self.preprocess = mock.patch.object(
+            self.service, '_preprocess_contract_text', wraps=self.service._preprocess_contract_text
+        ).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_01_identical_text_is_prepared_once(self):
+        first = self.service._prepare_contract(SAMPLE_CONTRACTS[0])
+        second = self.service._prepare_contract(SAMPLE_CONTRACTS[0])
+        self.assertIs(first, second)
+        self.assertEqual(self.preprocess.call_count, 1)
+
+    def test_02_least_recently_used_contract_is_evicted(self):
+        mock.patch.object(analyzer_module, '_PREPARED_CONTRACT_CACHE_SIZE', 2).start()
+        first, second, third = SAMPLE_CONTRACTS[:3]
+        self.service._prepare_contract(first)
+        self.service._prepare_contract(second)
+        self.service._prepare_contract(first)
+        self.service._prepare_contract(third)
+        self.assertEqual(len(self.service._prepared_contract_cache), 2)
+        self.assertEqual(self.preprocess.call_count, 3)
+        self.service._prepare_contract(first)
+        self.assertEqual(self.preprocess.call_count, 3)
+        self.service._prepare_contract(second)
+        self.assertEqual(self.preprocess.call_count, 4)
+
+
+class TestGraniteResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.service = ContractAnalyzerService()
+        self.service.watsonx_client = mock.Mock()
+        self.service.watsonx_client.analyze_contract.side_effect = lambda **kwargs: f"response {self.client_calls}"
+        self.now = 1000.0
+        mock.patch.object(analyzer_module.time, 'monotonic', lambda: self.now).start()
+        self.addCleanup(mock.patch.stopall)
+
+    @property
+    def client_calls(self):
+        return self.service.watsonx_client.analyze_contract.call_count
+
+    def _request(self, contract_text, jurisdiction='MY', contract_type='Employment'):
+        return self.service._request_granite_analysis(contract_text, {}, jurisdiction, contract_type)
+
+    def test_01_recent_response_is_reused(self):
+        first = self._request(SAMPLE_CONTRACTS[0])
+        self.now += analyzer_module._GRANITE_RESPONSE_TTL_SECONDS - 1
+        self.assertEqual(self._request(SAMPLE_CONTRACTS[0]), first)
+        self.assertEqual(self.client_calls, 1)
+
+    def test_02_jurisdiction_and_contract_type_are_part_of_the_key(self):
+        self._request(SAMPLE_CONTRACTS[0])
+        self._request(SAMPLE_CONTRACTS[0], jurisdiction='SG')
+        self._request(SAMPLE_CONTRACTS[0], contract_type='Service')
+        self.assertEqual(self.client_calls, 3)
+
+    def test_03_response_expires_after_ttl(self):
+        first = self._request(SAMPLE_CONTRACTS[0])
+        self.now += analyzer_module._GRANITE_RESPONSE_TTL_SECONDS
+        self.assertNotEqual(self._request(SAMPLE_CONTRACTS[0]), first)
+        self.assertEqual(self.client_calls, 2)
+
+    def test_04_least_recently_used_response_is_evicted(self):
+        mock.patch.object(analyzer_module, '_GRANITE_RESPONSE_CACHE_SIZE', 2).start()
+        first, second, third = SAMPLE_CONTRACTS[:3]
+        self._request(first)
+        self._request(second)
+        self._request(first)
+        self._request(third)
+        self.assertEqual(len(self.service._granite_response_cache), 2)
+        self._request(first)
+        self.assertEqual(self.client_calls, 3)
+        self._request(second)
+        self.assertEqual(self.client_calls, 4)
+
+
+class TestLawRiskCache(unittest.TestCase):
+    def setUp(self):
+        ContractAnalyzerService._get_risk_from_law.cache_clear()
+
+    def test_01_repeated_lookup_is_a_hit(self):
+        self.assertEqual(ContractAnalyzerService._get_risk_from_law("CCPA_US", 2), 75000 * 2.0)
+        self.assertEqual(ContractAnalyzerService._get_risk_from_law("CCPA_US", 2), 75000 * 2.0)
+        info = ContractAnalyzerService._get_risk_from_law.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_02_oldest_lookup_is_evicted(self):
+        maxsize = ContractAnalyzerService._get_risk_from_law.cache_info().maxsize
+        for violation_count in range(maxsize + 1):
+            ContractAnalyzerService._get_risk_from_law("PDPA_MY", violation_count)
+        ContractAnalyzerService._get_risk_from_law("PDPA_MY", 0)
+        info = ContractAnalyzerService._get_risk_from_law.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, maxsize + 2, maxsize))
+
+
+class TestOptionalMatcherFallbacks(unittest.TestCase):
+    def test_01_metadata_scan_without_automaton(self):
+        for contract_text in SAMPLE_CONTRACTS:
+            text_lower = contract_text.lower()
+            scanned = analyzer_module._find_metadata_phrases(text_lower)
+            with mock.patch.object(analyzer_module, '_METADATA_AUTOMATON', None):
+                self.assertEqual(analyzer_module._find_metadata_phrases(text_lower), scanned)
+
+    def test_02_phrase_matcher_without_ahocorasick(self):
+        phrases = ("rest day", "provident fund", "explicit consent")
+        matcher = analyzer_module._phrase_matcher(phrases)
+        with mock.patch.object(analyzer_module, 'ahocorasick', None):
+            fallback = analyzer_module._phrase_matcher(phrases)
+        for contract_text in SAMPLE_CONTRACTS:
+            with self.subTest(contract=contract_text[:30]):
+                self.assertEqual(fallback(contract_text.lower()), matcher(contract_text.lower()))
+
+    def test_03_json_helpers_without_orjson(self):
+        analysis = {"summary": "Gaji RM1,200 — İstanbul", "flagged_clauses": [], "risk": 1.5, "ok": True}
+        with_orjson = (json_utils.json_dumps(analysis), json_utils.json_loads('{"a": [1, 2.5, null]}'))
+        with mock.patch.object(json_utils, 'orjson', None):
+            self.assertEqual(json_utils.json_loads(json_utils.json_dumps(analysis)), analysis)
+            self.assertEqual(json_utils.json_loads('{"a": [1, 2.5, null]}'), with_orjson[1])
+            with self.assertRaises(json.JSONDecodeError):
+                json_utils.json_loads("{not json")
+        self.assertEqual(json_utils.json_loads(with_orjson[0]), analysis)
+        with self.assertRaises(json.JSONDecodeError):
+            json_utils.json_loads("{not json")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -183,6 +183,14 @@ class TestRegulatoryEngine(unittest.TestCase):
         self.assertIn("GDPR_EU", eu_data_checklist, 
                       "Data processing agreements should include GDPR.")
 
+    def test_11_compliance_checklist_is_cached(self):
+        first = self.engine.get_compliance_checklist("MY", "Employment Contract")
+        second = self.engine.get_compliance_checklist("my", "Employment Contract")
+        self.assertIs(first, second, "Repeated checklist lookups should reuse the cached checklist.")
+        
+        other_type = self.engine.get_compliance_checklist("MY", "Data Processing Agreement")
+        self.assertIsNot(first, other_type, "Checklists should be cached per contract type.")
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
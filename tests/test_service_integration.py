@@ -91,7 +91,7 @@ async def test_contract_analyzer_service():
     print("\n3. Testing Risk Scoring...")
     
     try:
-        risk_score = await service.calculate_risk_score(analysis_result)
+        risk_score = service.calculate_risk_score(analysis_result)
         
         print("✅ Risk scoring completed successfully")
         print(f"   📊 Overall score: {risk_score.overall_score}/100")